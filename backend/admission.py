@@ -0,0 +1,150 @@
+import asyncio
+from starlette.concurrency import run_in_threadpool
+import metrics
+
+# ================= CONFIG =================
+MAX_IN_FLIGHT = 32        # model calls running at once, all sessions
+MAX_QUEUED = 256          # frames waiting behind them, all sessions
+MAX_BATCH = 30            # word frames folded into one call (~1 s)
+# ==========================================
+
+# All bookkeeping below runs on the event loop thread, so no locks needed.
+# One call runs per session at a time (the leader). When it finishes it
+# returns its own result immediately and hands the session to the newest
+# request still waiting, which becomes the next leader.
+_sessions = {}
+_in_flight = 0
+_queued = 0
+
+
+class Busy(Exception):
+    pass
+
+
+class _Session:
+    def __init__(self, skipped):
+        self.running = False
+        self.pending = []       # [(frame, future)]
+        self.skipped = skipped  # answer for frames that are not run
+
+
+class _Turn:
+    # Resolves a waiting request's future when it becomes the leader
+    def __init__(self, frames):
+        self.frames = frames
+
+
+def _state(key, skipped):
+    session = _sessions.get(key)
+    if session is None:
+        session = _sessions[key] = _Session(skipped)
+    return session
+
+
+def _admit():
+    if _in_flight >= MAX_IN_FLIGHT or _queued >= MAX_QUEUED:
+        raise Busy()
+
+
+def _set_queued(delta):
+    global _queued
+    _queued += delta
+    metrics.ADMISSION_QUEUED.set(value=_queued)
+
+
+def _handoff(route, session_key, session, outcome):
+    # The newest live waiter runs next, carrying every frame queued up to
+    # it; older waiters are answered with `skipped` right away.
+    while session.pending:
+        batch, session.pending = session.pending, []
+        _set_queued(-len(batch))
+        live = [i for i, (_, future) in enumerate(batch) if not future.done()]
+        if not live:
+            continue    # every waiter disconnected
+        for i in live[:-1]:
+            batch[i][1].set_result(session.skipped)
+            metrics.ADMISSION.inc(route, outcome)
+        leader = live[-1]
+        batch[leader][1].set_result(_Turn([frame for frame, _ in batch[:leader + 1]]))
+        return
+
+    session.running = False
+    _sessions.pop((route, session_key), None)
+
+
+async def _run(fn, *args):
+    global _in_flight
+    _in_flight += 1
+    try:
+        return await run_in_threadpool(fn, *args)
+    finally:
+        _in_flight -= 1
+
+
+async def _wait_turn(route, session_key, session, future, outcome):
+    try:
+        return await future
+    except asyncio.CancelledError:
+        # Disconnected just as it was handed the session: pass it on
+        if future.done() and not future.cancelled() and isinstance(future.result(), _Turn):
+            _handoff(route, session_key, session, outcome)
+        raise
+
+
+async def latest_frame(route, session_key, frame, fn, superseded):
+    # Keep only the newest frame per session: a frame that is still
+    # waiting when a newer one arrives is answered with `superseded`.
+    session = _state((route, session_key), superseded)
+
+    if session.running:
+        if not session.pending:
+            _admit()
+        for _, old in session.pending:
+            if not old.done():
+                old.set_result(superseded)
+                metrics.ADMISSION.inc(route, "superseded")
+        _set_queued(1 - len(session.pending))
+        future = asyncio.get_running_loop().create_future()
+        session.pending = [(frame, future)]
+        turn = await _wait_turn(route, session_key, session, future, "superseded")
+        if not isinstance(turn, _Turn):
+            return turn
+    else:
+        _admit()
+        session.running = True
+
+    try:
+        result = await _run(fn, frame)
+        metrics.ADMISSION.inc(route, "served")
+        return result
+    finally:
+        _handoff(route, session_key, session, "superseded")
+
+
+async def batched_frames(route, session_key, frame, fn, coalesced):
+    # Frames that arrive while a call is running are queued; the newest
+    # of them runs next with all of them, the others get `coalesced`.
+    session = _state((route, session_key), coalesced)
+    frames = [frame]
+
+    if session.running:
+        if len(session.pending) >= MAX_BATCH:
+            raise Busy()
+        _admit()
+        _set_queued(1)
+        future = asyncio.get_running_loop().create_future()
+        session.pending.append((frame, future))
+        turn = await _wait_turn(route, session_key, session, future, "coalesced")
+        if not isinstance(turn, _Turn):
+            return turn
+        frames = turn.frames
+    else:
+        _admit()
+        session.running = True
+
+    try:
+        result = await _run(fn, frames)
+        metrics.ADMISSION.inc(route, "served")
+        return result
+    finally:
+        _handoff(route, session_key, session, "coalesced")
@@ -0,0 +1,114 @@
+import os
+import json
+import numpy as np
+from model_registry import load_label_map
+from shared_weights import EXPORTS, SHARED_DIR, MappedModel, export_keras
+import gating
+from word.sequence import MAX_GESTURE, MAX_LENGTH, MIN_FRAMES, MIN_VISIBLE, SEQUENCE_LENGTH
+
+# ================= CONFIG =================
+# Run from the backend folder: python -m browser_export
+# Writes model.json + weights.bin per model for frontend/src/lib/localModel.ts
+BROWSER_DIR = "../frontend/public/models"
+LABEL_MAPS = {
+    "alphabet": "models/label_map.json",
+    "word": "word/models/word_label_map.json",
+}
+
+# Same gates the server applies (gating.py, word/sequence.py)
+GATING = {
+    "alphabet": {"min_visible": gating.LETTER_MIN_VISIBLE,
+                 "confidence_threshold": gating.LETTER_CONFIDENCE,
+                 "smoothing_window": gating.LETTER_SMOOTHING},
+    "word": {"min_visible": MIN_VISIBLE, "confidence_threshold": gating.WORD_CONFIDENCE,
+             "smoothing_window": gating.WORD_SMOOTHING,
+             "sequence_length": SEQUENCE_LENGTH, "min_frames": MIN_FRAMES,
+             "max_length": MAX_LENGTH, "max_gesture": MAX_GESTURE},
+}
+# ==========================================
+
+
+def ensure_shared(name):
+    # Reuse the mmap export when it exists; otherwise build it from the .h5
+    out_dir = os.path.join(SHARED_DIR, name)
+    if not os.path.isfile(os.path.join(out_dir, "layers.json")):
+        from tensorflow.keras.models import load_model
+        export_keras(load_model(EXPORTS[name]), out_dir)
+    return out_dir
+
+
+def export_browser(name, shared_dir, label_map_path, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(shared_dir, "layers.json")) as f:
+        spec = json.load(f)
+
+    # One little-endian float32 blob, fetched once as an ArrayBuffer
+    offset = 0
+    layers = []
+    with open(os.path.join(out_dir, "weights.bin"), "wb") as blob:
+        for entry in spec["layers"]:
+            tensors = []
+            for file in entry["weights"]:
+                w = np.load(os.path.join(shared_dir, file)).astype("<f4")
+                blob.write(w.tobytes())
+                tensors.append({"offset": offset, "shape": list(w.shape)})
+                offset += w.size
+            layers.append(dict(entry, weights=tensors))
+
+    gating = dict(GATING[name])
+    if layers[0]["type"] == "masking":
+        # Trained with VARIABLE_LENGTH: whole gestures, no fixed window
+        gating["sequence_length"] = None
+
+    label_map = load_label_map(label_map_path)
+    manifest = {
+        "name": name,
+        "layers": layers,
+        "labels": [label_map[i] for i in range(len(label_map))],
+        "gating": gating,
+    }
+    with open(os.path.join(out_dir, "model.json"), "w") as f:
+        json.dump(manifest, f, indent=4)
+    return offset * 4
+
+
+def main():
+    for name in EXPORTS:
+        try:
+            shared_dir = ensure_shared(name)
+        except Exception as e:
+            print(f"❌ Could not export {name}: {e}")
+            continue
+
+        out_dir = os.path.join(BROWSER_DIR, name)
+        size = export_browser(name, shared_dir, LABEL_MAPS[name], out_dir)
+
+        # Sanity check: read the blob back the way the browser will
+        x = np.random.rand(*([2] + _input_shape(shared_dir))).astype(np.float32)
+        diff = np.abs(MappedModel(shared_dir).predict(x) - _replay(out_dir, x)).max()
+        print(f"✅ {name} → {out_dir} ({size / 1024:.0f} KB, max diff: {diff:.2e})")
+
+
+def _input_shape(shared_dir):
+    with open(os.path.join(shared_dir, "layers.json")) as f:
+        layers = [e for e in json.load(f)["layers"] if e["type"] != "masking"]
+    features = np.load(os.path.join(shared_dir, layers[0]["weights"][0]), mmap_mode="r").shape[0]
+    return [SEQUENCE_LENGTH, features] if layers[0]["type"] == "lstm" else [features]
+
+
+def _replay(out_dir, x):
+    with open(os.path.join(out_dir, "model.json")) as f:
+        manifest = json.load(f)
+    blob = np.fromfile(os.path.join(out_dir, "weights.bin"), dtype="<f4")
+
+    model = MappedModel.__new__(MappedModel)
+    model.layers = []
+    for entry in manifest["layers"]:
+        weights = [blob[t["offset"]:t["offset"] + int(np.prod(t["shape"]))].reshape(t["shape"])
+                   for t in entry["weights"]]
+        model.layers.append((entry, weights))
+    return model.predict(x)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import numpy as np
+
+# ================= CONFIG =================
+LEXICON_PATH = "models/lexicon.txt"
+
+BEAM_WIDTH = 8
+PRUNE_MARGIN = 12.0       # drop hypotheses this many nats behind the best
+MIN_LETTER_PROB = 0.02    # letters below this are not expanded
+LM_WEIGHT = 0.5           # weight of the lexicon prior vs. the model
+COMPLETE_SHARE = 0.8      # suggest a word once it holds this share of its prefix
+MIN_COMPLETE_PREFIX = 2
+EPS = 1e-6
+# ==========================================
+
+ALPHABET = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+
+
+def load_lexicon(path=LEXICON_PATH):
+    # One word per line, optionally followed by a frequency count
+    words = {}
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            word = "".join(ch for ch in parts[0].upper() if ch in ALPHABET)
+            count = float(parts[1]) if len(parts) > 1 else 1.0
+            if word:
+                words[word] = words.get(word, 0.0) + count
+    return words
+
+
+class LexiconIndex:
+    # Trie flattened into arrays so one beam step is a couple of lookups:
+    #   children[node, letter] -> child node or -1
+    #   log_prior[node]        -> log of the word mass under that prefix
+    #   best_word[node]        -> most frequent word completing the prefix
+
+    def __init__(self, words):
+        children = [[-1] * len(ALPHABET)]
+        parent, letter, terminal = [-1], [-1], [0.0]
+
+        for word, count in words.items():
+            node = 0
+            for ch in word:
+                c = ALPHABET.index(ch)
+                if children[node][c] < 0:
+                    children[node][c] = len(children)
+                    children.append([-1] * len(ALPHABET))
+                    parent.append(node)
+                    letter.append(c)
+                    terminal.append(0.0)
+                node = children[node][c]
+            terminal[node] += count
+
+        self.children = np.array(children, dtype=np.int32)
+        self.parent = np.array(parent, dtype=np.int32)
+        self.letter = np.array(letter, dtype=np.int32)
+        self.terminal = np.array(terminal, dtype=np.float64)
+        self.depth = np.zeros(len(parent), dtype=np.int32)
+
+        mass = self.terminal.copy()
+        best = np.where(self.terminal > 0, np.arange(len(parent)), -1)
+        best_count = self.terminal.copy()
+
+        # Children always have larger ids than their parent
+        for node in range(1, len(parent)):
+            self.depth[node] = self.depth[self.parent[node]] + 1
+        for node in range(len(parent) - 1, 0, -1):
+            p = self.parent[node]
+            mass[p] += mass[node]
+            if best_count[node] > best_count[p]:
+                best_count[p] = best_count[node]
+                best[p] = best[node]
+
+        self.mass = mass
+        self.log_prior = np.log(mass + EPS)
+        self.best_word = best
+        self.best_count = best_count
+
+    def text(self, node):
+        chars = []
+        while node > 0:
+            chars.append(ALPHABET[self.letter[node]])
+            node = self.parent[node]
+        return "".join(reversed(chars))
+
+    def is_word(self, node):
+        return self.terminal[node] > 0
+
+    def completion(self, node):
+        if node <= 0 or self.depth[node] < MIN_COMPLETE_PREFIX or self.best_word[node] < 0:
+            return None, 0.0
+        share = float(self.best_count[node] / self.mass[node])
+        return self.text(self.best_word[node]), share
+
+
+class FingerspellDecoder:
+    # Beam search over per-frame letter probabilities, constrained to
+    # prefixes of the lexicon. A hypothesis is (trie node, held letter,
+    # in_gap); a letter can repeat only after a low-confidence gap frame.
+
+    def __init__(self, index, letter_indices, beam_width=BEAM_WIDTH):
+        self.index = index
+        self.set_letters(letter_indices)
+        self.beam_width = beam_width
+        self.reset()
+
+    def set_letters(self, letter_indices):
+        # Model output index for each letter of ALPHABET, -1 where the
+        # model has no such class (its probability is then 0)
+        self.letter_indices = np.asarray(letter_indices, dtype=np.int64)
+        if self.letter_indices.shape != (len(ALPHABET),):
+            raise ValueError(f"Expected {len(ALPHABET)} letter indices, got {self.letter_indices.shape}")
+        self.known = self.letter_indices >= 0
+
+    def reset(self):
+        self.beams = {(0, -1, False): 0.0}
+        self.committed = ""
+
+    def step(self, probs):
+        probs = np.asarray(probs, dtype=np.float64)
+        letter_probs = np.zeros(len(ALPHABET))
+        letter_probs[self.known] = probs[self.letter_indices[self.known]]
+        logp = np.log(letter_probs + EPS)
+        log_gap = np.log(max(1.0 - probs.max(), EPS))
+        expandable = letter_probs >= MIN_LETTER_PROB
+
+        children = self.index.children
+        log_prior = self.index.log_prior
+        candidates = {}
+
+        def add(state, score):
+            if score > candidates.get(state, -np.inf):
+                candidates[state] = score
+
+        for (node, held, gap), score in self.beams.items():
+            if held >= 0 and not gap:
+                add((node, held, False), score + logp[held])
+            add((node, held, True), score + log_gap)
+
+            kids = children[node]
+            for c in np.flatnonzero((kids >= 0) & expandable):
+                if c == held and not gap:
+                    continue
+                child = kids[c]
+                lm = LM_WEIGHT * (log_prior[child] - log_prior[node])
+                add((int(child), int(c), False), score + logp[c] + lm)
+
+        ranked = sorted(candidates.items(), key=lambda kv: kv[1], reverse=True)
+        floor = ranked[0][1] - PRUNE_MARGIN
+        self.beams = {s: v for s, v in ranked[:self.beam_width] if v >= floor}
+        return self.result()
+
+    def _best_node(self):
+        return max(self.beams.items(), key=lambda kv: kv[1])[0][0]
+
+    def _common_prefix(self):
+        texts = [self.index.text(node) for node, _, _ in self.beams]
+        prefix = texts[0]
+        for t in texts[1:]:
+            n = 0
+            while n < min(len(prefix), len(t)) and prefix[n] == t[n]:
+                n += 1
+            prefix = prefix[:n]
+        return prefix
+
+    def result(self):
+        # Letters every surviving hypothesis agrees on are final
+        prefix = self._common_prefix()
+        new_letters = prefix[len(self.committed):] if len(prefix) > len(self.committed) else ""
+        self.committed = max(self.committed, prefix, key=len)
+
+        best = self._best_node()
+        completion, share = self.index.completion(best)
+        if share < COMPLETE_SHARE:
+            completion = None
+
+        return {
+            "letters": new_letters,
+            "prefix": self.index.text(best),
+            "completion": completion,
+            "completion_share": round(share, 4),
+        }
+
+    def end_word(self):
+        # Prefer the best hypothesis that is a complete lexicon word
+        ranked = sorted(self.beams.items(), key=lambda kv: kv[1], reverse=True)
+        word = None
+        for (node, _, _), _ in ranked:
+            if self.index.is_word(node):
+                word = self.index.text(node)
+                break
+        if word is None:
+            word = self.index.text(ranked[0][0][0])
+        self.reset()
+        return word or None
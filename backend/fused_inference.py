@@ -0,0 +1,185 @@
+import numpy as np
+from collections import deque
+import metrics
+import inference
+from model_registry import registry
+from prediction_cache import PredictionCache
+from session_state import SessionState, SessionStore
+from word import word_inference
+from word.sequence import FEATURES, MAX_GESTURE, MIN_VISIBLE, prepare
+from word.spotter import motion_energy
+
+# ================= CONFIG =================
+# One frame stream, both models. Frames are parsed into one array per
+# batch; the word model reads the gesture buffer, the alphabet model
+# reads its newest frame, and the arbitration below picks one label.
+LETTER_MIN_VISIBLE = inference.MIN_VISIBLE
+
+# Letters are held poses, words are movements: a letter is only accepted
+# once the hand has stayed this still for HOLD_FRAMES frames
+HOLD_FRAMES = 3
+HOLD_ENERGY = 0.006
+# ==========================================
+
+class FusedSession(SessionState):
+    def __init__(self):
+        super().__init__()
+        # Visible frames of the current gesture, oldest first
+        self.gesture = np.zeros((MAX_GESTURE, FEATURES), dtype=np.float32)
+        self.gesture_len = 0
+        self.consumed = False     # a word or letter already came from this gesture
+        self.letter_queue = deque(maxlen=inference.SMOOTHING_WINDOW)
+        self.word_queue = deque(maxlen=word_inference.SMOOTHING_WINDOW)
+        self.last_letter = ""
+        self.last_word = ""
+        self.cache = PredictionCache()
+        self.versions = (None, None)
+
+    def sync(self, letter_version, word_version):
+        # Votes cast by a model version that is no longer serving don't count
+        letter, word = self.versions
+        if letter_version != letter:
+            self.letter_queue.clear()
+        if word_version != word:
+            self.word_queue.clear()
+        self.versions = (letter_version, word_version)
+
+    def push(self, frame):
+        if self.gesture_len == MAX_GESTURE:
+            self.gesture[:-1] = self.gesture[1:]
+            self.gesture[-1] = frame
+        else:
+            self.gesture[self.gesture_len] = frame
+            self.gesture_len += 1
+
+    def frames(self, count=None):
+        start = 0 if count is None else self.gesture_len - count
+        return self.gesture[start:self.gesture_len]
+
+sessions = SessionStore(FusedSession)
+
+
+def _still(state):
+    if state.gesture_len <= HOLD_FRAMES:
+        return False
+    recent = state.frames(HOLD_FRAMES + 1)
+    energy = max(motion_energy(a, b) for a, b in zip(recent[:-1], recent[1:]))
+    return energy < HOLD_ENERGY
+
+
+def _vote(queue, idx, window):
+    queue.append(idx)
+    return queue.count(idx) > window // 2
+
+
+def _word_probs(bundle, x):
+    x = x[None, ...]
+    with metrics.stage("fused", "word"):
+        probs = bundle.predict(x)[0]
+    registry.shadow_score("word", x, probs)
+    idx = int(np.argmax(probs))
+    return bundle.label_map[idx], idx, float(probs[idx])
+
+
+def _finish_gesture(state):
+    # Hands dropped: classify the whole gesture (as word_inference does)
+    frames = state.frames().copy()
+    state.gesture_len = 0
+    if state.consumed:
+        state.consumed = False
+        return None, 0.0
+
+    bundle = registry.get("word")
+    x = prepare(frames, word_inference.sequence_length(bundle)) if len(frames) else None
+    if x is None:
+        return None, 0.0
+    word, _, confidence = _word_probs(bundle, x)
+    if confidence < word_inference.CONFIDENCE_THRESHOLD or word == state.last_word:
+        return None, confidence
+    return word, confidence
+
+
+def _word_window(state):
+    # Sliding window while the gesture is still going (word_inference.predict_word)
+    bundle = registry.get("word")
+    length = word_inference.sequence_length(bundle)
+    if length is None or state.gesture_len < length:
+        return None, 0.0
+    word, idx, confidence = _word_probs(bundle, state.frames(length))
+    if confidence < word_inference.CONFIDENCE_THRESHOLD:
+        return None, confidence
+    if _vote(state.word_queue, idx, word_inference.SMOOTHING_WINDOW) and word != state.last_word:
+        state.consumed = True
+        return word, confidence
+    return None, confidence
+
+
+def _letter(state, frame, visible):
+    # Same gate, cache and smoothing as inference.predict_landmarks,
+    # but the letter is only a candidate until arbitration accepts it
+    if visible < LETTER_MIN_VISIBLE:
+        return None, 0.0
+    bundle = inference.current_bundle()
+    probs = inference.predict_probs(frame, bundle, state.cache, stage=("fused", "letter"))
+    idx = int(np.argmax(probs))
+    confidence = float(probs[idx])
+    if confidence < inference.CONFIDENCE_THRESHOLD:
+        return None, confidence
+    char = bundle.label_map[idx]
+    if _vote(state.letter_queue, idx, inference.SMOOTHING_WINDOW) and char != state.last_letter:
+        return char, confidence
+    return None, confidence
+
+
+def _arbitrate(state, letter, word):
+    # A completed word always wins: the letters seen on the way were
+    # transitional poses. A letter needs the hand to be held still.
+    if word[0] is not None:
+        state.last_word = word[0]
+        state.last_letter = ""
+        state.letter_queue.clear()
+        state.word_queue.clear()
+        state.gesture_len = 0
+        return word[0], word[1], "word"
+
+    if letter[0] is not None and _still(state):
+        state.last_letter = letter[0]
+        # The held frames were spelling: keep them out of the word window
+        # and don't classify the rest of the gesture as a word at the end
+        state.gesture_len = 0
+        state.consumed = True
+        return letter[0], letter[1], "letter"
+
+    return None, max(letter[1], word[1]), None
+
+
+def predict_fused(frames, session=None):
+    # `frames` is every frame queued for this session (admission.batched_frames)
+    with metrics.stage("fused", "parse"):
+        x = np.asarray(frames, dtype=np.float32).reshape(len(frames), FEATURES)
+        visible = np.count_nonzero(x, axis=1)
+
+    state = sessions.get(session)
+    with state.lock:
+        state.sync(inference.current_bundle().version, registry.get("word").version)
+        word = (None, 0.0)
+        for frame, v in zip(x, visible):
+            if v >= MIN_VISIBLE:
+                state.push(frame)
+            elif state.gesture_len or state.consumed:
+                ended = _finish_gesture(state)
+                if ended[0] is not None or word[0] is None:
+                    word = ended
+
+        if word[0] is None and visible[-1] >= MIN_VISIBLE:
+            word = _word_window(state)
+        letter = _letter(state, x[-1], visible[-1])
+
+        label, confidence, kind = _arbitrate(state, letter, word)
+    return {
+        "label": label,
+        "confidence": confidence,
+        "type": kind,
+        "letter": {"label": letter[0], "confidence": letter[1]},
+        "word": {"label": word[0], "confidence": word[1]},
+    }
@@ -0,0 +1,11 @@
+# ================= CONFIG =================
+# Gates shared by the server (inference.py, word/word_inference.py,
+# fused_inference.py) and browser_export.py, so the on-device predictors
+# always ship the values the server is running with.
+LETTER_MIN_VISIBLE = 40       # non-zero landmark values before a frame counts
+LETTER_CONFIDENCE = 0.88
+LETTER_SMOOTHING = 4
+
+WORD_CONFIDENCE = 0.85        # word frames are gated by word.sequence.MIN_VISIBLE
+WORD_SMOOTHING = 3
+# ==========================================
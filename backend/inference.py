@@ -1,43 +1,128 @@
-import json
 import numpy as np
 from collections import deque
-from tensorflow.keras.models import load_model
+import metrics
+import gating
+from model_registry import registry, select_backend
+from prediction_cache import PredictionCache
+from fingerspell_decoder import ALPHABET, FingerspellDecoder, LexiconIndex, load_lexicon
+from session_state import SessionState, SessionStore
 
 MODEL_PATH = "models/alphabet_number_model.h5"
 LABEL_MAP_PATH = "models/label_map.json"
+LEXICON_PATH = "models/lexicon.txt"
+MODEL_VERSION = "v1"
 
-CONFIDENCE_THRESHOLD = 0.88
-SMOOTHING_WINDOW = 4
+# ISL_MODEL_BACKEND=mmap serves the shared_weights.py export instead
+MODEL_BACKEND, MODEL_PATH, LABEL_MAP_PATH = select_backend("alphabet", MODEL_PATH, LABEL_MAP_PATH)
+FEATURE_SPEC = {"input_shape": [126], "backend": MODEL_BACKEND}
 
-model = load_model(MODEL_PATH)
+MIN_VISIBLE = gating.LETTER_MIN_VISIBLE
+CONFIDENCE_THRESHOLD = gating.LETTER_CONFIDENCE
+SMOOTHING_WINDOW = gating.LETTER_SMOOTHING
 
-with open(LABEL_MAP_PATH) as f:
-    label_map = {int(k): v for k, v in json.load(f).items()}
+registry.ensure("alphabet", MODEL_VERSION, MODEL_PATH, LABEL_MAP_PATH, FEATURE_SPEC)
 
-prediction_queue = deque(maxlen=SMOOTHING_WINDOW)
-last_char = ""
+def letter_indices(label_map):
+    # One slot per letter A-Z, -1 for letters this model doesn't know
+    index = {v: i for i, v in label_map.items()}
+    return [index.get(ch, -1) for ch in ALPHABET]
 
-def predict_landmarks(landmarks):
-    global last_char
+lexicon_index = LexiconIndex(load_lexicon(LEXICON_PATH))
 
-    if np.count_nonzero(landmarks) < 40:
-        return None, 0.0
+class LetterSession(SessionState):
+    # Smoothing and fingerspelling state for one client
+    def __init__(self):
+        super().__init__()
+        bundle = registry.get("alphabet")
+        self.version = bundle.version
+        self.queue = deque(maxlen=SMOOTHING_WINDOW)
+        self.last_char = ""
+        self.decoder = FingerspellDecoder(lexicon_index, letter_indices(bundle.label_map))
+        # Held letters produce near-identical frames; reuse their probabilities
+        self.cache = PredictionCache()
+
+    def sync(self, bundle):
+        # A newly activated version invalidates everything derived from the old one
+        if bundle.version != self.version:
+            self.version = bundle.version
+            self.queue.clear()
+            self.decoder.set_letters(letter_indices(bundle.label_map))
+            self.decoder.reset()
+
+sessions = SessionStore(LetterSession)
 
+def current_bundle():
+    return registry.get("alphabet")
+
+def predict_probs(landmarks, bundle, cache, stage=("alphabet", "predict")):
+    # `stage` lets fused_inference record the call under its own name
     x = np.array(landmarks, dtype=np.float32).reshape(1, -1)
-    probs = model.predict(x, verbose=0)[0]
+    cache.sync(bundle.version)
+    probs = cache.get(x[0])
+    if probs is None:
+        with metrics.stage(*stage):
+            probs = bundle.predict(x)[0]
+        cache.put(x[0], probs)
+        registry.shadow_score("alphabet", x, probs)
+    return probs
+
+def predict_landmarks(landmarks, session=None):
+    with metrics.stage("alphabet", "gate"):
+        visible = np.count_nonzero(landmarks)
+    if visible < MIN_VISIBLE:
+        return None, 0.0
 
+    bundle = current_bundle()
+    state = sessions.get(session)
+    probs = predict_probs(landmarks, bundle, state.cache)
+
+    with state.lock, metrics.stage("alphabet", "smoothing"):
+        state.sync(bundle)
+        return _smooth(state, probs, bundle.label_map)
+
+def _smooth(state, probs, label_map):
     idx = int(np.argmax(probs))
     confidence = float(probs[idx])
 
     if confidence < CONFIDENCE_THRESHOLD:
         return None, confidence
 
-    prediction_queue.append(idx)
+    state.queue.append(idx)
 
-    if prediction_queue.count(idx) > SMOOTHING_WINDOW // 2:
+    if state.queue.count(idx) > SMOOTHING_WINDOW // 2:
         char = label_map[idx]
-        if char != last_char:
-            last_char = char
+        if char != state.last_char:
+            state.last_char = char
             return char, confidence
 
-    return None, confidence
\ No newline at end of file
+    return None, confidence
+
+def cache_stats():
+    # Summed over the live sessions; /metrics has the running totals
+    states = sessions.states()
+    totals = {"sessions": len(states)}
+    for key in ("lookups", "hits", "near_hits", "misses", "entries"):
+        totals[key] = sum(state.cache.stats()[key] for state in states)
+    reused = totals["hits"] + totals["near_hits"]
+    totals["hit_rate"] = round(reused / totals["lookups"], 4) if totals["lookups"] else 0.0
+    return totals
+
+# ================= FINGERSPELLING =================
+# Keeps every probability vector and lets the lexicon decide, so letters
+# commit sooner and repeated letters (HELLO) are possible.
+def decode_landmarks(landmarks, session=None):
+    state = sessions.get(session)
+    if np.count_nonzero(landmarks) < MIN_VISIBLE:
+        # Hands dropped: the word is finished
+        with state.lock:
+            word = state.decoder.end_word()
+        return {"letters": "", "prefix": "", "completion": None,
+                "completion_share": 0.0, "word": word}
+
+    bundle = current_bundle()
+    probs = predict_probs(landmarks, bundle, state.cache)
+    with state.lock, metrics.stage("spell", "decode"):
+        state.sync(bundle)
+        result = state.decoder.step(probs)
+    result["word"] = None
+    return result
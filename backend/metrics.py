@@ -0,0 +1,198 @@
+import os
+import time
+import bisect
+import threading
+import contextvars
+from contextlib import contextmanager
+from session_state import SessionStore
+
+# ================= CONFIG =================
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SESSION_IDLE_SECONDS = 60.0
+MAX_TRACKED_SESSIONS = 10000    # oldest dropped beyond this (ids are client-supplied)
+# ==========================================
+
+_lock = threading.Lock()
+
+
+def _label_str(names, values):
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help_text, labels=()):
+        self.name, self.help, self.labels = name, help_text, tuple(labels)
+        self.values = {}
+
+    def inc(self, *label_values, amount=1.0):
+        with _lock:
+            self.values[label_values] = self.values.get(label_values, 0.0) + amount
+
+    def samples(self):
+        for key, value in sorted(self.values.items()):
+            yield self.name + _label_str(self.labels, key), value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labels=(), fn=None):
+        super().__init__(name, help_text, labels)
+        self.fn = fn
+
+    def set(self, *label_values, value):
+        with _lock:
+            self.values[label_values] = value
+
+    def dec(self, *label_values, amount=1.0):
+        self.inc(*label_values, amount=-amount)
+
+    def samples(self):
+        if self.fn is not None:
+            yield self.name, self.fn()
+            return
+        yield from super().samples()
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name, self.help, self.labels = name, help_text, tuple(labels)
+        self.buckets = tuple(buckets)
+        self.values = {}
+
+    def observe(self, *label_values, value):
+        i = bisect.bisect_left(self.buckets, value)
+        with _lock:
+            entry = self.values.get(label_values)
+            if entry is None:
+                entry = self.values[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][i] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    @contextmanager
+    def time(self, *label_values):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(*label_values, value=time.perf_counter() - start)
+
+    def samples(self):
+        names = self.labels + ("le",)
+        for key, (counts, total, count) in sorted(self.values.items()):
+            cumulative = 0
+            for bound, c in zip(self.buckets + (float("inf"),), counts):
+                cumulative += c
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                yield self.name + "_bucket" + _label_str(names, key + (le,)), cumulative
+            yield self.name + "_sum" + _label_str(self.labels, key), total
+            yield self.name + "_count" + _label_str(self.labels, key), count
+
+
+_metrics = []
+
+
+def _register(metric):
+    _metrics.append(metric)
+    return metric
+
+
+def render():
+    lines = []
+    with _lock:
+        for metric in _metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, value in metric.samples():
+                lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+# ================= SESSIONS =================
+# Keyed by the client's X-Session-Id, so expiry and the size cap are
+# applied on every touch, not only when /metrics is scraped
+_sessions = SessionStore(lambda: None, idle_timeout=SESSION_IDLE_SECONDS,
+                         max_sessions=MAX_TRACKED_SESSIONS)
+
+
+def touch_session(session_id):
+    _sessions.get(session_id)
+
+
+def active_sessions():
+    return len(_sessions)
+
+
+def process_memory_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        # Peak RSS; kilobytes on Linux, bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except ImportError:
+        return 0
+
+
+# ================= METRICS =================
+REQUEST_LATENCY = _register(Histogram(
+    "isl_request_duration_seconds", "End-to-end request latency per route.", ["route"]))
+STAGE_LATENCY = _register(Histogram(
+    "isl_stage_duration_seconds", "Latency of individual pipeline stages.", ["model", "stage"]))
+REQUESTS = _register(Counter(
+    "isl_requests_total", "Requests handled per route and status code.", ["route", "status"]))
+PREDICTIONS = _register(Counter(
+    "isl_predictions_total", "Labels emitted per model.", ["model", "label"]))
+IN_FLIGHT = _register(Gauge(
+    "isl_requests_in_flight", "Requests currently being processed."))
+ACTIVE_SESSIONS = _register(Gauge(
+    "isl_active_sessions", "Clients seen in the last minute.", fn=active_sessions))
+CACHE_LOOKUPS = _register(Counter(
+    "isl_prediction_cache_lookups_total", "Alphabet prediction cache lookups by outcome.", ["outcome"]))
+ADMISSION = _register(Counter(
+    "isl_admission_total", "Frames served, superseded, coalesced or shed per route.", ["route", "outcome"]))
+ADMISSION_QUEUED = _register(Gauge(
+    "isl_admission_queued", "Frames waiting behind an in-flight request."))
+MODEL_LOAD = _register(Gauge(
+    "isl_model_load_seconds", "Time spent loading each model.", ["model"]))
+MODEL_WARMUP = _register(Gauge(
+    "isl_model_warmup_seconds", "Time spent on the first (warm-up) prediction.", ["model"]))
+MEMORY = _register(Gauge(
+    "isl_process_resident_memory_bytes", "Resident memory of this process.", fn=process_memory_bytes))
+
+
+# Set by the server middleware so handlers can time request parsing
+request_start = contextvars.ContextVar("request_start", default=None)
+
+
+def mark_parsed(model):
+    start = request_start.get()
+    if start is not None:
+        STAGE_LATENCY.observe(model, "parse", value=time.perf_counter() - start)
+
+
+def stage(model, name):
+    return STAGE_LATENCY.time(model, name)
+
+
+@contextmanager
+def timed_load(model):
+    start = time.perf_counter()
+    yield
+    MODEL_LOAD.set(model, value=round(time.perf_counter() - start, 4))
+
@@ -1,21 +1,23 @@
-import json
 import numpy as np
-from tensorflow.keras.models import load_model
+from model_registry import registry, select_backend
 
 MODEL_PATH = "models/alphabet_number_model.h5"
 LABEL_MAP_PATH = "models/label_map.json"
+MODEL_VERSION = "v1"
 
-model = load_model(MODEL_PATH)
+# ISL_MODEL_BACKEND=mmap serves the shared_weights.py export instead
+MODEL_BACKEND, MODEL_PATH, LABEL_MAP_PATH = select_backend("alphabet", MODEL_PATH, LABEL_MAP_PATH)
+FEATURE_SPEC = {"input_shape": [126], "backend": MODEL_BACKEND}
 
-with open(LABEL_MAP_PATH, "r") as f:
-    label_map = json.load(f)
-label_map = {int(k): v for k, v in label_map.items()}
+# Shares the bundle with inference.py instead of loading a second copy
+registry.ensure("alphabet", MODEL_VERSION, MODEL_PATH, LABEL_MAP_PATH, FEATURE_SPEC)
 
 def predict_landmarks(landmarks):
+    bundle = registry.get("alphabet")
     data = np.array(landmarks, dtype=np.float32).reshape(1, -1)
-    probs = model.predict(data, verbose=0)[0]
+    probs = bundle.predict(data)[0]
     idx = int(np.argmax(probs))
     return {
-        "label": label_map[idx],
+        "label": bundle.label_map[idx],
         "confidence": float(probs[idx])
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,246 @@
+import os
+import json
+import time
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+import metrics
+
+# ================= CONFIG =================
+SHADOW_WORKERS = 1
+SHADOW_MAX_PENDING = 8    # shadow scoring is dropped beyond this backlog
+# ==========================================
+
+
+def keras_loader(path):
+    from tensorflow.keras.models import load_model
+    return load_model(path)
+
+
+def mmap_loader(path):
+    # Weights exported by shared_weights.py; no TensorFlow import needed
+    from shared_weights import MappedModel
+    return MappedModel(path)
+
+
+def torch_loader(path):
+    from torch_models import TorchModel
+    return TorchModel(path)
+
+
+LOADERS = {"keras": keras_loader, "mmap": mmap_loader, "torch": torch_loader}
+
+# Artifacts each non-Keras backend serves in place of the .h5 model:
+# mmap reads the weights exported by shared_weights.py (mapped read-only
+# and shared by every uvicorn worker), torch reads word_lstm_model.pth.
+# A label map of None keeps the Keras one.
+BACKEND_PATHS = {
+    ("alphabet", "mmap"): ("models/shared/alphabet", None),
+    ("word", "mmap"): ("models/shared/word", None),
+    ("word", "torch"): ("word/word_lstm_model.pth", "word/word_labels.json"),
+}
+
+
+def select_backend(name, model_path, label_map_path, env=("ISL_MODEL_BACKEND",)):
+    # The first of the env vars that is set picks the backend (default keras);
+    # returns (backend, model_path, label_map_path) for registry.ensure
+    backend = next((os.environ[var] for var in env if os.environ.get(var)), "keras")
+    if backend == "keras":
+        return backend, model_path, label_map_path
+    if (name, backend) not in BACKEND_PATHS:
+        raise ValueError(f"No {backend} artifacts for the {name} model")
+    backend_model, backend_labels = BACKEND_PATHS[(name, backend)]
+    return backend, backend_model, backend_labels or label_map_path
+
+
+def load_label_map(path):
+    # JSON {"0": "Bye", ...}; label maps are never unpickled, since a
+    # pickle can run arbitrary code when loaded
+    if not path.endswith(".json"):
+        raise ValueError(f"Label map must be a .json file: {path}")
+    with open(path) as f:
+        return {int(k): v for k, v in json.load(f).items()}
+
+
+class ModelBundle:
+    def __init__(self, name, version, model, label_map, spec):
+        self.name = name
+        self.version = version
+        self.model = model
+        self.label_map = label_map
+        self.spec = spec            # {"input_shape": [...], "backend": "keras", ...}
+        self.loaded_at = time.time()
+
+    def predict(self, x):
+        return self.model.predict(x, verbose=0)
+
+    def describe(self):
+        return {"version": self.version, "spec": self.spec, "loaded_at": self.loaded_at}
+
+
+def load_bundle(name, version, model_path, label_map_path, spec):
+    loader = LOADERS[spec.get("backend", "keras")]
+
+    with metrics.timed_load(name):
+        model = loader(model_path)
+
+    label_map = load_label_map(label_map_path)
+
+    bundle = ModelBundle(name, version, model, label_map, spec)
+    # First call builds the graph; pay for it before taking traffic
+    start = time.perf_counter()
+    # Variable-length dimensions (None) warm up with a single step
+    shape = [1] + [d or 1 for d in spec["input_shape"]]
+    bundle.predict(np.zeros(shape, dtype=np.float32))
+    metrics.MODEL_WARMUP.set(name, value=round(time.perf_counter() - start, 4))
+    return bundle
+
+
+class _Slot:
+    def __init__(self):
+        self.versions = {}
+        self.active = None
+        self.pinned = None
+        self.shadow = None
+        self.loading = {}
+        self.shadow_stats = {"scored": 0, "agree": 0, "dropped": 0,
+                             "conf_delta_sum": 0.0, "latency_ms_sum": 0.0}
+
+
+class ModelRegistry:
+    # Serving code calls get(name) once per request and keeps that bundle
+    # for the whole call, so swapping `active` never affects a request
+    # that is already running.
+
+    def __init__(self):
+        self.slots = {}
+        self.lock = threading.Lock()
+        self.shadow_pool = ThreadPoolExecutor(max_workers=SHADOW_WORKERS)
+        self.shadow_pending = 0
+
+    def _slot(self, name):
+        with self.lock:
+            return self.slots.setdefault(name, _Slot())
+
+    # -------- loading --------
+    def load(self, name, version, model_path, label_map_path, spec, activate=True):
+        bundle = load_bundle(name, version, model_path, label_map_path, spec)
+        slot = self._slot(name)
+        with self.lock:
+            slot.versions[version] = bundle
+            if activate or slot.active is None:
+                slot.active = version
+        print(f"📦 Loaded {name} {version}{' (active)' if slot.active == version else ''}")
+        return bundle
+
+    def ensure(self, name, version, model_path, label_map_path, spec):
+        # Used by the inference modules at import: load the default
+        # bundle once, whichever module gets there first.
+        slot = self._slot(name)
+        if version not in slot.versions:
+            self.load(name, version, model_path, label_map_path, spec, activate=slot.active is None)
+        return self.get(name)
+
+    def load_async(self, name, version, model_path, label_map_path, spec, activate=True):
+        slot = self._slot(name)
+
+        def run():
+            try:
+                self.load(name, version, model_path, label_map_path, spec, activate)
+                slot.loading.pop(version, None)
+            except Exception as e:
+                slot.loading[version] = f"failed: {e}"
+
+        slot.loading[version] = "loading"
+        threading.Thread(target=run, daemon=True).start()
+
+    # -------- serving --------
+    def get(self, name):
+        slot = self.slots[name]
+        return slot.versions[slot.pinned or slot.active]
+
+    def activate(self, name, version):
+        slot = self._slot(name)
+        with self.lock:
+            if version not in slot.versions:
+                raise KeyError(f"{name} has no loaded version {version}")
+            slot.active = version
+
+    def pin(self, name, version):
+        slot = self._slot(name)
+        with self.lock:
+            if version is not None and version not in slot.versions:
+                raise KeyError(f"{name} has no loaded version {version}")
+            slot.pinned = version
+
+    def set_shadow(self, name, version):
+        slot = self._slot(name)
+        with self.lock:
+            if version is not None and version not in slot.versions:
+                raise KeyError(f"{name} has no loaded version {version}")
+            slot.shadow = version
+
+    def unload(self, name, version):
+        slot = self._slot(name)
+        with self.lock:
+            if version in (slot.active, slot.pinned):
+                raise ValueError("Cannot unload the version that is serving traffic")
+            slot.versions.pop(version, None)
+            if slot.shadow == version:
+                slot.shadow = None
+
+    # -------- shadow scoring --------
+    def shadow_score(self, name, x, served_probs):
+        # Runs the shadow candidate on the same input off the request path
+        # and records how often it agrees with the served model.
+        slot = self.slots.get(name)
+        if slot is None or slot.shadow is None:
+            return
+        candidate = slot.versions.get(slot.shadow)
+        if candidate is None:
+            return
+        with self.lock:
+            if self.shadow_pending >= SHADOW_MAX_PENDING:
+                slot.shadow_stats["dropped"] += 1
+                return
+            self.shadow_pending += 1
+        self.shadow_pool.submit(self._score, slot, candidate, np.array(x), np.array(served_probs))
+
+    def _score(self, slot, candidate, x, served_probs):
+        try:
+            start = time.perf_counter()
+            probs = candidate.predict(x)[0]
+            stats = slot.shadow_stats
+            stats["latency_ms_sum"] += (time.perf_counter() - start) * 1000.0
+            stats["scored"] += 1
+            stats["agree"] += int(np.argmax(probs) == np.argmax(served_probs))
+            stats["conf_delta_sum"] += float(np.max(probs) - np.max(served_probs))
+        finally:
+            with self.lock:
+                self.shadow_pending -= 1
+
+    # -------- status --------
+    def status(self):
+        out = {}
+        for name, slot in self.slots.items():
+            s = slot.shadow_stats
+            scored = s["scored"] or 1
+            out[name] = {
+                "active": slot.active,
+                "pinned": slot.pinned,
+                "serving": slot.pinned or slot.active,
+                "shadow": slot.shadow,
+                "loading": dict(slot.loading),
+                "versions": {v: b.describe() for v, b in slot.versions.items()},
+                "shadow_stats": {
+                    "scored": s["scored"],
+                    "dropped": s["dropped"],
+                    "agreement": round(s["agree"] / scored, 4),
+                    "mean_conf_delta": round(s["conf_delta_sum"] / scored, 4),
+                    "mean_latency_ms": round(s["latency_ms_sum"] / scored, 3),
+                },
+            }
+        return out
+
+
+registry = ModelRegistry()
@@ -0,0 +1,115 @@
+import time
+import threading
+import numpy as np
+from collections import OrderedDict
+import metrics
+
+# ================= CONFIG =================
+QUANT_STEP = 0.01       # landmark grid size used for the cache key
+TOLERANCE = 0.005       # max |diff| to reuse the previous frame's result
+MAX_ENTRIES = 256
+TTL_SECONDS = 2.0
+# ==========================================
+
+
+class PredictionCache:
+    # One per session (see inference.LetterSession); the lock only guards
+    # against the odd overlapping call for the same session.
+
+    def __init__(self, quant_step=QUANT_STEP, tolerance=TOLERANCE,
+                 max_entries=MAX_ENTRIES, ttl=TTL_SECONDS):
+        self.quant_step = quant_step
+        self.tolerance = tolerance
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.version = None         # model version the entries came from
+        self.last_x = None
+        self.last_probs = None
+        self.last_time = 0.0
+
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+    def key(self, x):
+        return np.round(x / self.quant_step).astype(np.int16).tobytes()
+
+    def get(self, x):
+        with self.lock:
+            probs, outcome = self._lookup(x)
+        metrics.CACHE_LOOKUPS.inc(outcome)
+        return probs
+
+    def _lookup(self, x):
+        now = time.monotonic()
+
+        # Held sign: nearly identical to the previous frame
+        if (self.last_x is not None and now - self.last_time <= self.ttl
+                and np.max(np.abs(x - self.last_x)) <= self.tolerance):
+            self.near_hits += 1
+            return self.last_probs, "near_hit"
+
+        key = self.key(x)
+        entry = self.entries.get(key)
+        if entry is not None:
+            probs, stamp = entry
+            if now - stamp <= self.ttl:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                self._remember(x, probs, now)
+                return probs, "hit"
+            del self.entries[key]
+
+        self.misses += 1
+        return None, "miss"
+
+    def put(self, x, probs):
+        now = time.monotonic()
+        key = self.key(x)
+        with self.lock:
+            self.entries[key] = (probs, now)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self._remember(x, probs, now)
+
+    def sync(self, version):
+        # Entries from another model version are useless
+        with self.lock:
+            if version != self.version:
+                self.version = version
+                self._clear()
+
+    def _remember(self, x, probs, now):
+        self.last_x = x
+        self.last_probs = probs
+        self.last_time = now
+
+    def clear(self):
+        with self.lock:
+            self._clear()
+
+    def _clear(self):
+        self.entries.clear()
+        self.last_x = None
+        self.last_probs = None
+
+    def stats(self):
+        with self.lock:
+            return self._stats()
+
+    def _stats(self):
+        lookups = self.hits + self.near_hits + self.misses
+        return {
+            "lookups": lookups,
+            "hits": self.hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.near_hits) / lookups, 4) if lookups else 0.0,
+            "entries": len(self.entries),
+            "quant_step": self.quant_step,
+            "tolerance": self.tolerance,
+        }
@@ -0,0 +1,101 @@
+import os
+import time
+import random
+import shutil
+import cProfile
+import threading
+from contextlib import contextmanager
+
+# ================= CONFIG =================
+# ISL_PROFILE_RATE=0.01 profiles 1% of calls; 0 (default) disables it.
+PROFILE_RATE = float(os.environ.get("ISL_PROFILE_RATE", "0"))
+PROFILE_DIR = os.environ.get("ISL_PROFILE_DIR", "profiles")
+PROFILE_KEEP = int(os.environ.get("ISL_PROFILE_KEEP", "50"))
+PROFILE_TF = os.environ.get("ISL_PROFILE_TF", "0") == "1"
+# ==========================================
+
+settings = {
+    "rate": PROFILE_RATE,
+    "tf": PROFILE_TF,
+    "dir": PROFILE_DIR,
+    "keep": PROFILE_KEEP,
+}
+stats = {"sampled": 0, "skipped_busy": 0, "last_dump": None}
+
+# cProfile and the TF profiler can only run one session at a time
+_busy = threading.Lock()
+
+
+def configure(rate=None, tf=None):
+    if rate is not None:
+        settings["rate"] = max(0.0, min(1.0, float(rate)))
+    if tf is not None:
+        settings["tf"] = bool(tf)
+    return status()
+
+
+def status():
+    return {**settings, **stats}
+
+
+@contextmanager
+def profiled(name, force=False):
+    if not force and (settings["rate"] <= 0 or random.random() >= settings["rate"]):
+        yield
+        return
+
+    if not _busy.acquire(blocking=False):
+        stats["skipped_busy"] += 1
+        yield
+        return
+
+    try:
+        os.makedirs(settings["dir"], exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S") + f"-{stats['sampled']:06d}"
+        base = os.path.join(settings["dir"], f"{name}-{stamp}")
+
+        tf_started = settings["tf"] and _start_tf_trace(base + ".tf")
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            if tf_started:
+                _stop_tf_trace()
+            # .pstats opens in snakeviz / flameprof / gprof2dot
+            profiler.dump_stats(base + ".pstats")
+            stats["sampled"] += 1
+            stats["last_dump"] = base + ".pstats"
+            _rotate()
+    finally:
+        _busy.release()
+
+
+def _start_tf_trace(logdir):
+    try:
+        import tensorflow as tf
+        tf.profiler.experimental.start(logdir)
+        return True
+    except Exception as e:
+        print(f"⚠ TF profiler unavailable: {e}")
+        return False
+
+
+def _stop_tf_trace():
+    import tensorflow as tf
+    tf.profiler.experimental.stop()
+
+
+def _rotate():
+    # Keep only the newest dumps; TF trace folders rotate with them
+    entries = sorted(
+        (os.path.join(settings["dir"], e) for e in os.listdir(settings["dir"])),
+        key=os.path.getmtime,
+    )
+    dumps = [e for e in entries if e.endswith(".pstats")]
+    for old in dumps[:max(0, len(dumps) - settings["keep"])]:
+        os.remove(old)
+        tf_dir = old[:-len(".pstats")] + ".tf"
+        if os.path.isdir(tf_dir):
+            shutil.rmtree(tf_dir, ignore_errors=True)
@@ -1,10 +1,22 @@
-from fastapi import FastAPI
+import os
+import hmac
+import time
+from functools import partial
+from types import SimpleNamespace
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from pydantic import BaseModel
-from inference import predict_landmarks
-from word.word_inference import predict_word   # 🔥 ADD THIS
+from typing import Optional
+import metrics
+import profiling
+import admission
+from model_registry import LOADERS, registry
+from inference import predict_landmarks, decode_landmarks, cache_stats
+from word.word_inference import predict_word_frames, predict_word_stream   # 🔥 ADD THIS
+from fused_inference import predict_fused
+from sign_assets import atlas_path, rebuild_index, sign_index
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from googletrans import Translator
 app = FastAPI()
 
 app.add_middleware(
@@ -15,7 +27,138 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-translator = Translator()
+class StubTranslator:
+    # Offline stand-in (ISL_TRANSLATOR=stub) for load tests: echoes the text
+    def translate(self, text, src="auto", dest="en"):
+        return SimpleNamespace(text=text)
+
+if os.environ.get("ISL_TRANSLATOR") == "stub":
+    translator = StubTranslator()
+else:
+    from googletrans import Translator
+    translator = Translator()
+
+def session_id(request: Request):
+    return request.headers.get("x-session-id") or (
+        request.client.host if request.client else "unknown"
+    )
+
+# ================= METRICS =================
+@app.middleware("http")
+async def record_metrics(request: Request, call_next):
+    start = time.perf_counter()
+    metrics.request_start.set(start)
+    metrics.touch_session(session_id(request))
+    metrics.IN_FLIGHT.inc()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        metrics.IN_FLIGHT.dec()
+        # Use the route template, not the raw path, to keep label cardinality bounded
+        route = request.scope.get("route")
+        path = route.path if route is not None else "unmatched"
+        metrics.REQUEST_LATENCY.observe(path, value=time.perf_counter() - start)
+        metrics.REQUESTS.inc(path, str(status))
+
+@app.get("/metrics")
+def metrics_route():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+# ================= ADMIN =================
+# /admin/* needs ISL_ADMIN_TOKEN in the x-admin-token header; without a
+# token configured it is only served to clients on this machine.
+ADMIN_TOKEN = os.environ.get("ISL_ADMIN_TOKEN")
+LOCAL_CLIENTS = {"127.0.0.1", "::1", "localhost"}
+MODEL_DIRS = ["models", "word"]   # model and label map paths must resolve inside these
+
+def require_admin(request: Request):
+    if ADMIN_TOKEN:
+        token = request.headers.get("x-admin-token", "")
+        if not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+            raise HTTPException(status_code=401, detail="Admin token required")
+    elif request.client is None or request.client.host not in LOCAL_CLIENTS:
+        raise HTTPException(status_code=403, detail="Admin routes are localhost-only unless ISL_ADMIN_TOKEN is set")
+
+admin = [Depends(require_admin)]
+
+def model_file(path):
+    real = os.path.realpath(path)
+    for root in MODEL_DIRS:
+        root = os.path.realpath(root)
+        if os.path.commonpath([real, root]) == root:
+            return path
+    raise HTTPException(status_code=400, detail=f"{path} is outside {', '.join(MODEL_DIRS)}")
+
+# ================= PROFILING =================
+class ProfilingRequest(BaseModel):
+    rate: Optional[float] = None
+    tf: Optional[bool] = None
+
+@app.get("/admin/profiling", dependencies=admin)
+def profiling_status():
+    return profiling.status()
+
+@app.post("/admin/profiling", dependencies=admin)
+def profiling_configure(req: ProfilingRequest):
+    return profiling.configure(rate=req.rate, tf=req.tf)
+
+# ================= MODEL REGISTRY =================
+class ModelLoadRequest(BaseModel):
+    version: str
+    model_path: str
+    label_map_path: str
+    input_shape: Optional[list[int]] = None
+    backend: str = "keras"
+    activate: bool = True
+
+class VersionRequest(BaseModel):
+    version: Optional[str] = None
+
+@app.get("/admin/models", dependencies=admin)
+def models_status():
+    return registry.status()
+
+@app.post("/admin/models/{name}/load", dependencies=admin)
+def models_load(name: str, req: ModelLoadRequest):
+    # Loads and warms in the background; traffic keeps using the current version
+    if name not in registry.slots:
+        raise HTTPException(status_code=404, detail=f"Unknown model {name}")
+    if req.backend not in LOADERS:
+        raise HTTPException(status_code=400, detail=f"Unknown backend {req.backend}")
+    spec = dict(registry.get(name).spec, backend=req.backend)
+    if req.input_shape is not None:
+        spec["input_shape"] = req.input_shape
+    if not req.label_map_path.endswith(".json"):
+        raise HTTPException(status_code=400, detail="label_map_path must be a .json file")
+    registry.load_async(name, req.version, model_file(req.model_path),
+                        model_file(req.label_map_path), spec, activate=req.activate)
+    return {"status": "loading", "name": name, "version": req.version}
+
+def _registry_call(fn, name, version):
+    try:
+        fn(name, version)
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return registry.status().get(name)
+
+@app.post("/admin/models/{name}/activate", dependencies=admin)
+def models_activate(name: str, req: VersionRequest):
+    return _registry_call(registry.activate, name, req.version)
+
+@app.post("/admin/models/{name}/pin", dependencies=admin)
+def models_pin(name: str, req: VersionRequest):
+    return _registry_call(registry.pin, name, req.version)
+
+@app.post("/admin/models/{name}/shadow", dependencies=admin)
+def models_shadow(name: str, req: VersionRequest):
+    return _registry_call(registry.set_shadow, name, req.version)
+
+@app.delete("/admin/models/{name}/{version}", dependencies=admin)
+def models_unload(name: str, version: str):
+    return _registry_call(registry.unload, name, version)
 
 class TranslateRequest(BaseModel):
     text: str
@@ -24,29 +167,192 @@ class TranslateRequest(BaseModel):
 
 @app.post("/translate")
 async def translate_text(req: TranslateRequest):
-    translated = translator.translate(
-        req.text,
-        src=req.source,
-        dest=req.target
-    )
+    with metrics.stage("translate", "network"):
+        translated = translator.translate(
+            req.text,
+            src=req.source,
+            dest=req.target
+        )
     return {"translated_text": translated.text}
+
+# ================= TEXT TO SIGN =================
+class SignPlanRequest(BaseModel):
+    text: str
+    source: str = "en"
+    target: Optional[str] = None
+
+try:
+    rebuild_index()
+except (OSError, ValueError) as e:
+    print(f"⚠️ Text to sign disabled: {e}")
+
+def require_sign_index():
+    index = sign_index()
+    if index is None:
+        raise HTTPException(status_code=503, detail="No sign images; add them to frontend/public/isl and rebuild the atlas")
+    return index
+
+@app.post("/admin/sign-atlas/rebuild", dependencies=admin)
+def sign_atlas_rebuild():
+    try:
+        index = rebuild_index()
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"version": index.atlas["version"], "signs": len(index.frames)}
+
+@app.post("/sign-plan")
+def sign_plan(req: SignPlanRequest):
+    # Both translations and the playback plan in one round trip
+    index = require_sign_index()
+    text = req.text.strip()
+    translated = text
+    english = text
+    with metrics.stage("translate", "network"):
+        if req.target and req.target != req.source:
+            translated = translator.translate(text, src=req.source, dest=req.target).text
+        if req.source != "en":
+            english = translator.translate(text, src=req.source, dest="en").text
+
+    with metrics.stage("sign_plan", "index"):
+        words = index.plan(english)
+
+    atlas = index.atlas
+    return {
+        "text": english,
+        "translated_text": translated,
+        "atlas": {
+            "url": f"/sign-atlas/{atlas['version']}.jpg",
+            "cell": atlas["cell"],
+            "width": atlas["width"],
+            "height": atlas["height"],
+        },
+        "words": words,
+    }
+
+@app.get("/sign-atlas/{version}.jpg")
+def sign_atlas(version: str):
+    # Versioned by content, so browsers may keep it forever
+    index = sign_index()
+    if index is None or version != index.atlas["version"] or not os.path.isfile(atlas_path(version)):
+        raise HTTPException(status_code=404, detail="Unknown atlas version")
+    return FileResponse(
+        atlas_path(version), media_type="image/jpeg",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"}
+    )
+
 class Input(BaseModel):
     landmarks: list[float]
 
+# ================= ADMISSION =================
+# Frames that are skipped rather than run (see admission.py)
+SKIPPED = {"label": None, "confidence": 0.0, "skipped": True}
+
+def busy_response(route):
+    metrics.ADMISSION.inc(route, "shed")
+    return JSONResponse(
+        status_code=503,
+        content={"label": None, "confidence": 0.0, "busy": True}
+    )
+
 # ================= ALPHABET =================
+def _predict_alphabet(landmarks, session):
+    with profiling.profiled("predict"):
+        return predict_landmarks(landmarks, session)
+
 @app.post("/predict")
-def predict(data: Input):
-    char, confidence = predict_landmarks(data.landmarks)
+async def predict(data: Input, request: Request):
+    metrics.mark_parsed("alphabet")
+    sid = session_id(request)
+    try:
+        result = await admission.latest_frame(
+            "/predict", sid, data.landmarks,
+            partial(_predict_alphabet, session=sid), superseded=SKIPPED
+        )
+    except admission.Busy:
+        return busy_response("/predict")
+    if result is SKIPPED:
+        return SKIPPED
+
+    char, confidence = result
+    if char is not None:
+        metrics.PREDICTIONS.inc("alphabet", char)
     return {
         "label": char,
         "confidence": confidence
     }
 
+@app.post("/predict-spell")
+def predict_spell(data: Input, request: Request):
+    metrics.mark_parsed("spell")
+    with profiling.profiled("predict_spell"):
+        result = decode_landmarks(data.landmarks, session_id(request))
+    if result["word"]:
+        metrics.PREDICTIONS.inc("spell", result["word"])
+    return result
+
+@app.get("/predict/cache")
+def predict_cache_stats():
+    return cache_stats()
+
 # ================= WORD =================
+def _predict_word_frames(frames, session):
+    with profiling.profiled("predict_word"):
+        return predict_word_frames(frames, session)
+
 @app.post("/predict-word")
-def predict_word_route(data: Input):
-    word, confidence = predict_word(data.landmarks)
+async def predict_word_route(data: Input, request: Request):
+    metrics.mark_parsed("word")
+    sid = session_id(request)
+    try:
+        result = await admission.batched_frames(
+            "/predict-word", sid, data.landmarks,
+            partial(_predict_word_frames, session=sid), coalesced=SKIPPED
+        )
+    except admission.Busy:
+        return busy_response("/predict-word")
+    if result is SKIPPED:
+        return SKIPPED
+
+    word, confidence = result
+    if word is not None:
+        metrics.PREDICTIONS.inc("word", word)
     return {
         "label": word,
         "confidence": confidence
-    }
\ No newline at end of file
+    }
+
+@app.post("/predict-word-stream")
+def predict_word_stream_route(data: Input, request: Request):
+    metrics.mark_parsed("word_stream")
+    with profiling.profiled("predict_word_stream"):
+        word, confidence = predict_word_stream(data.landmarks, session_id(request))
+    if word is not None:
+        metrics.PREDICTIONS.inc("word_stream", word)
+    return {
+        "label": word,
+        "confidence": confidence
+    }
+
+# ================= FUSED =================
+# Alphabet + word on one stream: one parse, one scheduled call per batch
+def _predict_fused(frames, session):
+    with profiling.profiled("predict_fused"):
+        return predict_fused(frames, session)
+
+@app.post("/predict-fused")
+async def predict_fused_route(data: Input, request: Request):
+    metrics.mark_parsed("fused")
+    sid = session_id(request)
+    try:
+        result = await admission.batched_frames(
+            "/predict-fused", sid, data.landmarks,
+            partial(_predict_fused, session=sid), coalesced=SKIPPED
+        )
+    except admission.Busy:
+        return busy_response("/predict-fused")
+    if result is SKIPPED:
+        return SKIPPED
+
+    if result["label"] is not None:
+        metrics.PREDICTIONS.inc("fused", result["label"])
+    return result
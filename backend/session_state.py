@@ -0,0 +1,58 @@
+import time
+import threading
+from collections import OrderedDict
+
+# ================= CONFIG =================
+IDLE_TIMEOUT = 60.0       # seconds without a frame before a session's state is dropped
+MAX_SESSIONS = 1024       # per store; the least recently seen go first
+LOCAL_SESSION = "local"   # scripts and benchmarks that don't pass a session
+# ==========================================
+
+
+class SessionStore:
+    # Per-session model state (frame buffers, smoothing queues, decoders),
+    # keyed by the same session id as admission.py, so concurrent clients
+    # never share buffers. Each state carries its own lock for the rare
+    # case of two calls for one session running at once.
+
+    def __init__(self, factory, idle_timeout=IDLE_TIMEOUT, max_sessions=MAX_SESSIONS):
+        self.factory = factory
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self._states = OrderedDict()      # key -> (state, last_seen)
+        self._lock = threading.Lock()
+
+    def get(self, key=None):
+        key = key or LOCAL_SESSION
+        now = time.monotonic()
+        with self._lock:
+            entry = self._states.pop(key, None)
+            state = entry[0] if entry else self.factory()
+            self._states[key] = (state, now)
+            self._evict(now)
+            return state
+
+    def _evict(self, now):
+        while self._states:
+            _, (_, seen) = next(iter(self._states.items()))
+            if now - seen < self.idle_timeout and len(self._states) <= self.max_sessions:
+                break
+            self._states.popitem(last=False)
+
+    def states(self):
+        with self._lock:
+            return [state for state, _ in self._states.values()]
+
+    def clear(self):
+        with self._lock:
+            self._states.clear()
+
+    def __len__(self):
+        with self._lock:
+            self._evict(time.monotonic())
+            return len(self._states)
+
+
+class SessionState:
+    def __init__(self):
+        self.lock = threading.Lock()
@@ -0,0 +1,152 @@
+import os
+import json
+import numpy as np
+
+# ================= CONFIG =================
+# Run from the backend folder: python -m shared_weights
+SHARED_DIR = "models/shared"
+EXPORTS = {
+    "alphabet": "models/alphabet_number_model.h5",
+    "word": "word/models/word_model.h5",
+}
+# ==========================================
+
+# Weights are stored as plain .npy files and opened with mmap_mode="r",
+# so every worker process maps the same page-cache pages read-only and
+# no process needs TensorFlow just to serve predictions.
+
+
+def _activation(name):
+    if name == "relu":
+        return lambda z: np.maximum(z, 0.0)
+    if name == "softmax":
+        def softmax(z):
+            e = np.exp(z - z.max(axis=-1, keepdims=True))
+            return e / e.sum(axis=-1, keepdims=True)
+        return softmax
+    if name == "sigmoid":
+        return lambda z: 1.0 / (1.0 + np.exp(-z))
+    if name == "hard_sigmoid":
+        return lambda z: np.clip(0.2 * z + 0.5, 0.0, 1.0)
+    if name == "tanh":
+        return np.tanh
+    if name == "linear":
+        return lambda z: z
+    raise ValueError(f"Unsupported activation: {name}")
+
+
+def export_keras(model, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    layers = []
+
+    for layer in model.layers:
+        kind = layer.__class__.__name__
+        config = layer.get_config()
+        weights = layer.get_weights()
+
+        if kind in ("Dropout", "InputLayer"):
+            continue
+        if kind == "Masking":
+            entry = {"type": "masking", "mask_value": config["mask_value"]}
+        elif kind == "Dense":
+            entry = {"type": "dense", "activation": config["activation"]}
+        elif kind == "LSTM":
+            entry = {
+                "type": "lstm",
+                "activation": config["activation"],
+                "recurrent_activation": config["recurrent_activation"],
+                "return_sequences": config["return_sequences"],
+            }
+        else:
+            raise ValueError(f"Cannot export layer type {kind}")
+
+        entry["weights"] = []
+        for i, w in enumerate(weights):
+            file = f"{len(layers)}_{i}.npy"
+            np.save(os.path.join(out_dir, file), np.ascontiguousarray(w, dtype=np.float32))
+            entry["weights"].append(file)
+        layers.append(entry)
+
+    with open(os.path.join(out_dir, "layers.json"), "w") as f:
+        json.dump({"layers": layers}, f, indent=4)
+
+
+class MappedModel:
+    # Forward pass over memory-mapped weights; mirrors Keras predict()
+
+    def __init__(self, path):
+        with open(os.path.join(path, "layers.json")) as f:
+            spec = json.load(f)
+
+        self.layers = []
+        for entry in spec["layers"]:
+            weights = [np.load(os.path.join(path, w), mmap_mode="r") for w in entry["weights"]]
+            self.layers.append((entry, weights))
+
+    def predict(self, x, verbose=0):
+        out = np.asarray(x, dtype=np.float32)
+        mask = None
+        for entry, weights in self.layers:
+            if entry["type"] == "masking":
+                mask = np.any(out != entry["mask_value"], axis=-1)
+            elif entry["type"] == "dense":
+                kernel, bias = weights
+                out = _activation(entry["activation"])(out @ kernel + bias)
+            else:
+                out = _lstm(out, entry, weights, mask)
+                if not entry["return_sequences"]:
+                    mask = None
+        return out
+
+
+def _lstm(x, entry, weights, mask=None):
+    kernel, recurrent, bias = weights
+    act = _activation(entry["activation"])
+    rec_act = _activation(entry["recurrent_activation"])
+
+    batch, steps, _ = x.shape
+    units = recurrent.shape[0]
+    # Input projection for every step at once; only the recurrence is sequential
+    xw = x @ kernel + bias
+    h = np.zeros((batch, units), dtype=np.float32)
+    c = np.zeros((batch, units), dtype=np.float32)
+    outputs = []
+
+    for t in range(steps):
+        z = xw[:, t] + h @ recurrent
+        i = rec_act(z[:, :units])
+        f = rec_act(z[:, units:2 * units])
+        g = act(z[:, 2 * units:3 * units])
+        o = rec_act(z[:, 3 * units:])
+        c_next = f * c + i * g
+        h_next = o * act(c_next)
+        if mask is None:
+            h, c = h_next, c_next
+        else:
+            # Masked (padding) steps carry the previous state through
+            keep = mask[:, t, None]
+            h = np.where(keep, h_next, h)
+            c = np.where(keep, c_next, c)
+        if entry["return_sequences"]:
+            outputs.append(h)
+
+    return np.stack(outputs, axis=1) if entry["return_sequences"] else h
+
+
+def main():
+    from tensorflow.keras.models import load_model
+
+    for name, model_path in EXPORTS.items():
+        out_dir = os.path.join(SHARED_DIR, name)
+        model = load_model(model_path)
+        export_keras(model, out_dir)
+
+        # Sanity check against Keras before anyone serves from it
+        shape = [4] + list(model.input_shape[1:])
+        x = np.random.rand(*shape).astype(np.float32)
+        diff = np.abs(model.predict(x, verbose=0) - MappedModel(out_dir).predict(x)).max()
+        print(f"✅ Exported {name} → {out_dir} (max diff vs Keras: {diff:.2e})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import os
+import re
+import json
+import hashlib
+import tempfile
+import numpy as np
+
+# ================= CONFIG =================
+# Run from the backend folder: python -m sign_assets  (the server also
+# builds it at startup if it is missing or out of date)
+ISL_DIR = "../frontend/public/isl"          # <CHAR>.jpg, optional words/<WORD>.jpg
+ATLAS_DIR = "models/atlas"
+CELL = 128                                  # px per sign in the atlas
+COLUMNS = 8
+JPEG_QUALITY = 85
+IMAGE_EXTS = (".jpg", ".jpeg", ".png")
+# ==========================================
+
+# Every sign image packed into one sprite sheet, named by a hash of its
+# inputs so it can be cached forever; a sentence then renders from a
+# single download instead of one request per letter.
+
+
+def _scan(isl_dir):
+    # {"A": path, ..., "HELLO": path}; word signs live under words/
+    assets = {}
+    for folder in (isl_dir, os.path.join(isl_dir, "words")):
+        if not os.path.isdir(folder):
+            continue
+        for file in sorted(os.listdir(folder)):
+            stem, ext = os.path.splitext(file)
+            if ext.lower() in IMAGE_EXTS:
+                assets[stem.upper()] = os.path.join(folder, file)
+    return assets
+
+
+def _fingerprint(assets):
+    h = hashlib.sha1()
+    for key, path in sorted(assets.items()):
+        st = os.stat(path)
+        h.update(f"{key}:{st.st_size}:{int(st.st_mtime)}".encode())
+    h.update(f"{CELL}:{COLUMNS}:{JPEG_QUALITY}".encode())
+    return h.hexdigest()[:12]
+
+
+def _fit(image):
+    # Letterbox into a CELL×CELL square on white, keeping aspect ratio
+    import cv2
+    h, w = image.shape[:2]
+    scale = CELL / max(h, w)
+    resized = cv2.resize(image, (max(1, round(w * scale)), max(1, round(h * scale))),
+                         interpolation=cv2.INTER_AREA)
+    cell = np.full((CELL, CELL, 3), 255, dtype=np.uint8)
+    y = (CELL - resized.shape[0]) // 2
+    x = (CELL - resized.shape[1]) // 2
+    cell[y:y + resized.shape[0], x:x + resized.shape[1]] = resized
+    return cell
+
+
+def build_atlas(isl_dir=ISL_DIR, out_dir=ATLAS_DIR):
+    import cv2
+
+    assets = _scan(isl_dir)
+    if not assets:
+        raise FileNotFoundError(f"No sign images in {isl_dir}")
+
+    version = _fingerprint(assets)
+    index_path = os.path.join(out_dir, f"atlas-{version}.json")
+    if os.path.isfile(index_path):
+        try:
+            with open(index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass    # unreadable: build it again
+
+    keys = sorted(assets)
+    rows = -(-len(keys) // COLUMNS)
+    sheet = np.full((rows * CELL, COLUMNS * CELL, 3), 255, dtype=np.uint8)
+    frames = {}
+    for i, key in enumerate(keys):
+        image = cv2.imread(assets[key], cv2.IMREAD_COLOR)
+        if image is None:
+            continue
+        x, y = (i % COLUMNS) * CELL, (i // COLUMNS) * CELL
+        sheet[y:y + CELL, x:x + CELL] = _fit(image)
+        frames[key] = [x, y]
+
+    os.makedirs(out_dir, exist_ok=True)
+    image_file = f"atlas-{version}.jpg"
+    ok, jpg = cv2.imencode(".jpg", sheet, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+    if not ok:
+        raise OSError("Could not encode the sign atlas")
+    _write_atomic(os.path.join(out_dir, image_file), jpg.tobytes())
+
+    index = {
+        "version": version,
+        "image": image_file,
+        "cell": CELL,
+        "width": COLUMNS * CELL,
+        "height": rows * CELL,
+        "frames": frames,
+    }
+    # Index last: once it exists, the image it names is complete
+    _write_atomic(index_path, json.dumps(index, indent=4).encode())
+    return index
+
+
+def _write_atomic(path, data):
+    # Every uvicorn worker may build the atlas at startup; readers only
+    # ever see a missing file or a complete one
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)     # mkstemp creates it owner-only
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class SignIndex:
+    # Word → its own sign if there is one, otherwise spelled letter by letter
+
+    def __init__(self, atlas):
+        self.atlas = atlas
+        self.frames = atlas["frames"]
+
+    def _sign(self, key):
+        x, y = self.frames[key]
+        return {"label": key, "x": x, "y": y}
+
+    def plan(self, text):
+        words = []
+        for token in re.findall(r"[A-Za-z0-9]+", text.upper()):
+            if len(token) > 1 and token in self.frames:
+                words.append({"word": token, "kind": "word", "signs": [self._sign(token)]})
+                continue
+            signs = [self._sign(ch) for ch in token if ch in self.frames]
+            if signs:
+                words.append({"word": token, "kind": "letters", "signs": signs})
+        return words
+
+
+_index = None
+
+def rebuild_index():
+    # Rescans ISL_DIR; the server calls this at startup and on
+    # POST /admin/sign-atlas/rebuild, never per request
+    global _index
+    _index = SignIndex(build_atlas())
+    return _index
+
+
+def sign_index():
+    # None when no atlas could be built (no sign images)
+    return _index
+
+
+def atlas_path(version):
+    return os.path.join(ATLAS_DIR, f"atlas-{version}.jpg")
+
+
+def main():
+    atlas = build_atlas()
+    size = os.path.getsize(os.path.join(ATLAS_DIR, atlas["image"]))
+    print(f"✅ {len(atlas['frames'])} signs → {ATLAS_DIR}/{atlas['image']} "
+          f"({atlas['width']}×{atlas['height']}, {size / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
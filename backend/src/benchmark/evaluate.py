@@ -0,0 +1,226 @@
+import os
+import sys
+import json
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from metrics import process_memory_bytes
+from model_registry import load_bundle
+from src.benchmark.holdout import holdout_mask, is_holdout_file
+from src.benchmark.timing import summarize
+from word.sequence import pad_batch, prepare
+
+# ================= CONFIG =================
+# Run from the backend folder:
+#   python -m src.benchmark.evaluate                    # compare against baselines
+#   python -m src.benchmark.evaluate --save-baseline    # accept current numbers
+CSV_PATH = "data/landmarks/alphabet_number_landmarks_2hand.csv"
+WORD_DATA_DIR = "word/data/word_sequences"
+BASELINE_DIR = "eval/baselines"
+
+MODELS = {
+    "alphabet": {
+        "model": "models/alphabet_number_model.h5",
+        "label_map": "models/label_map.json",
+        "spec": {"input_shape": [126], "backend": "keras"},
+    },
+    "word": {
+        "model": "word/models/word_model.h5",
+        "label_map": "word/models/word_label_map.json",
+        "spec": {"input_shape": [20, 126], "backend": "keras"},
+    },
+}
+
+CALIBRATION_BINS = 10
+SINGLE_RUNS = 200
+BATCH_SIZE = 64
+
+ACCURACY_TOLERANCE = 0.01      # absolute drop allowed
+LATENCY_TOLERANCE = 0.25       # relative slowdown allowed ...
+LATENCY_FLOOR_MS = 0.5         # ... ignoring jitter below this
+# ==========================================
+
+
+def load_alphabet_holdout():
+    df = pd.read_csv(CSV_PATH, low_memory=False)
+    X = df.iloc[:, :-1].values.astype(np.float32)
+    y = df.iloc[:, -1].astype(str).values
+    mask = holdout_mask(y)
+    return X[mask], list(y[mask])
+
+
+def load_word_holdout(sequence_length):
+    X, y = [], []
+    for word in sorted(os.listdir(WORD_DATA_DIR)):
+        path = os.path.join(WORD_DATA_DIR, word)
+        if not os.path.isdir(path):
+            continue
+        for file in sorted(os.listdir(path)):
+            full = os.path.join(path, file)
+            if file.endswith(".npy") and is_holdout_file(full):
+                seq = prepare(np.load(full), sequence_length)
+                if seq is not None:
+                    X.append(seq)
+                    y.append(word)
+    if sequence_length is None and X:
+        return pad_batch(X), y
+    return np.array(X, dtype=np.float32), y
+
+
+def calibration(confidences, correct):
+    # Expected calibration error over equal-width confidence bins
+    bins = np.linspace(0.0, 1.0, CALIBRATION_BINS + 1)
+    ece = 0.0
+    for lo, hi in zip(bins[:-1], bins[1:]):
+        in_bin = (confidences > lo) & (confidences <= hi)
+        if in_bin.any():
+            ece += in_bin.mean() * abs(confidences[in_bin].mean() - correct[in_bin].mean())
+    return round(float(ece), 4)
+
+
+def score(bundle, X, y):
+    index = {str(v).lower(): k for k, v in bundle.label_map.items()}
+    keep = [i for i, label in enumerate(y) if str(label).lower() in index]
+    if not keep:
+        raise ValueError("No held-out samples match the model's labels")
+
+    X = X[keep]
+    true = np.array([index[str(y[i]).lower()] for i in keep])
+    probs = np.concatenate([bundle.predict(X[i:i + BATCH_SIZE]) for i in range(0, len(X), BATCH_SIZE)])
+    pred = np.argmax(probs, axis=1)
+    confidences = probs.max(axis=1)
+    correct = (pred == true).astype(np.float64)
+
+    n = len(bundle.label_map)
+    confusion = np.bincount(true * n + pred, minlength=n * n).reshape(n, n)
+    per_class = {}
+    for k, label in sorted(bundle.label_map.items()):
+        support = int(confusion[k].sum())
+        if support:
+            per_class[label] = {
+                "support": support,
+                "accuracy": round(float(confusion[k, k] / support), 4),
+            }
+
+    onehot = np.eye(n)[true]
+    return {
+        "samples": len(keep),
+        "accuracy": round(float(correct.mean()), 4),
+        "per_class": per_class,
+        "confusion": confusion.tolist(),
+        "ece": calibration(confidences, correct),
+        "brier": round(float(((probs - onehot) ** 2).sum(axis=1).mean()), 4),
+        "mean_confidence": round(float(confidences.mean()), 4),
+    }
+
+
+def speed(bundle, X):
+    single = []
+    for i in range(SINGLE_RUNS):
+        t = time.perf_counter()
+        bundle.predict(X[i % len(X)][None, ...])
+        single.append((time.perf_counter() - t) * 1000.0)
+
+    batch = X[:BATCH_SIZE]
+    t = time.perf_counter()
+    bundle.predict(batch)
+    batch_ms = (time.perf_counter() - t) * 1000.0
+
+    return {
+        "single_sample": summarize(single),
+        "batch_size": len(batch),
+        "batch_ms": round(batch_ms, 3),
+        "batch_per_sample_ms": round(batch_ms / len(batch), 4),
+    }
+
+
+def evaluate(name, model_path, label_map_path, spec):
+    if name == "alphabet":
+        X, y = load_alphabet_holdout()
+    else:
+        X, y = load_word_holdout(spec["input_shape"][0])
+    if len(X) == 0:
+        raise ValueError(f"No held-out data for {name}")
+
+    mem_before = process_memory_bytes()
+    bundle = load_bundle(name, "eval", model_path, label_map_path, spec)
+    mem_after = process_memory_bytes()
+
+    result = {"model": model_path, "backend": spec["backend"]}
+    result.update(score(bundle, X, y))
+    result["speed"] = speed(bundle, X)
+    result["memory_mb"] = round((mem_after - mem_before) / 1024 / 1024, 1)
+    return result
+
+
+def regressions(result, baseline):
+    problems = []
+    if result["accuracy"] < baseline["accuracy"] - ACCURACY_TOLERANCE:
+        problems.append(f"accuracy {baseline['accuracy']} → {result['accuracy']}")
+
+    for key in ("p50_ms", "p95_ms"):
+        old = baseline["speed"]["single_sample"][key]
+        new = result["speed"]["single_sample"][key]
+        if new > old * (1 + LATENCY_TOLERANCE) and new - old > LATENCY_FLOOR_MS:
+            problems.append(f"single-sample {key} {old:.2f} → {new:.2f} ms")
+
+    old = baseline["speed"]["batch_per_sample_ms"]
+    new = result["speed"]["batch_per_sample_ms"]
+    if new > old * (1 + LATENCY_TOLERANCE) and (new - old) * result["speed"]["batch_size"] > LATENCY_FLOOR_MS:
+        problems.append(f"batched per-sample {old:.3f} → {new:.3f} ms")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate model artifacts on the fixed held-out sets")
+    parser.add_argument("--models", default=",".join(MODELS))
+    parser.add_argument("--model-path", default=None, help="override the artifact (single model only)")
+    parser.add_argument("--label-map", default=None)
+    parser.add_argument("--backend", default=None, help="keras | mmap | torch")
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    names = [m.strip() for m in args.models.split(",") if m.strip()]
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    failed = False
+
+    for name in names:
+        cfg = MODELS[name]
+        spec = dict(cfg["spec"])
+        if args.backend:
+            spec["backend"] = args.backend
+        model_path = args.model_path or cfg["model"]
+        label_map_path = args.label_map or cfg["label_map"]
+
+        result = evaluate(name, model_path, label_map_path, spec)
+        single = result["speed"]["single_sample"]
+        print(f"\n📊 {name}: acc {result['accuracy'] * 100:.2f}% on {result['samples']} held-out | "
+              f"ECE {result['ece']} | p50 {single['p50_ms']:.2f} ms | p95 {single['p95_ms']:.2f} ms | "
+              f"batch {result['speed']['batch_per_sample_ms']:.3f} ms/sample | +{result['memory_mb']} MB")
+
+        baseline_path = os.path.join(BASELINE_DIR, f"{name}.json")
+        if args.save_baseline:
+            with open(baseline_path, "w") as f:
+                json.dump(result, f, indent=4)
+            print(f"📁 Baseline saved at: {baseline_path}")
+            continue
+
+        if not os.path.isfile(baseline_path):
+            print(f"⚠ No baseline for {name}; run with --save-baseline first")
+            continue
+
+        with open(baseline_path) as f:
+            problems = regressions(result, json.load(f))
+        if problems:
+            failed = True
+            for p in problems:
+                print(f"❌ {name} regressed: {p}")
+        else:
+            print(f"✅ {name} within baseline")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import os
+import zlib
+import numpy as np
+
+# ================= CONFIG =================
+# Fixed evaluation split shared by evaluate.py and both training scripts.
+# Consecutive alphabet rows are near-identical frames of one capture, so
+# rows are held out in blocks: a label's rows in CSV order, BLOCK_ROWS at
+# a time. Membership depends on the label and block number only, so it
+# survives reruns and data appended for other labels.
+HOLDOUT_PERCENT = 20
+BLOCK_ROWS = 20           # ~0.7 s of capture_data.py frames
+# ==========================================
+
+
+def _bucket(key):
+    return zlib.crc32(key) % 100
+
+
+def _block_keys(labels):
+    # "<label>/<block>", counting each label's rows in CSV order
+    seen = {}
+    keys = []
+    for label in labels:
+        row = seen.get(label, 0)
+        seen[label] = row + 1
+        keys.append(f"{label}/{row // BLOCK_ROWS}")
+    return keys
+
+
+def holdout_mask(labels):
+    # The lowest-hashing HOLDOUT_PERCENT of each label's blocks (at least
+    # one), so every label is evaluated and no block straddles the split
+    keys = _block_keys([str(label) for label in labels])
+    blocks = {}
+    for key in dict.fromkeys(keys):
+        blocks.setdefault(key.rsplit("/", 1)[0], []).append(key)
+    held = set()
+    for label_blocks in blocks.values():
+        ranked = sorted(label_blocks, key=lambda key: zlib.crc32(key.encode()))
+        held.update(ranked[:max(1, round(len(ranked) * HOLDOUT_PERCENT / 100))])
+    return np.array([key in held for key in keys], dtype=bool)
+
+
+def is_holdout_file(path):
+    # Keyed on "<WORD>/<file>" so the data root can move
+    word = os.path.basename(os.path.dirname(path)).lower()
+    name = os.path.basename(path)
+    return _bucket(f"{word}/{name}".encode()) < HOLDOUT_PERCENT
@@ -0,0 +1,255 @@
+import os
+import sys
+import json
+import time
+import random
+import queue
+import argparse
+import threading
+import subprocess
+import http.client
+from src.benchmark.sources import load_landmark_stream
+from src.benchmark.timing import summarize
+from src.benchmark.worker_memory import children
+
+# ================= CONFIG =================
+# Run from the backend folder, e.g.
+#   python -m src.benchmark.load_test --spawn --signers 8 --duration 30
+HOST = "127.0.0.1"
+PORT = 8000
+SOURCE = "word/data/word_sequences"
+ROUTES = ("/predict", "/predict-word")
+SIGNERS = 4
+CONNECTIONS = 6           # per signer, like a browser's per-host limit
+FPS = 30.0
+DURATION = 20.0
+REPORT_PATH = "load_report.json"
+# ==========================================
+
+
+class Signer(threading.Thread):
+    # One simulated client. Like CameraFeed.tsx it fires a request per frame
+    # on a fixed schedule without waiting for earlier responses, so a slow
+    # server sees several frames in flight per session. Latency is measured
+    # from each frame's scheduled send time (no coordinated omission).
+
+    def __init__(self, sid, frames, routes, host, port, fps, stop_at, connections=CONNECTIONS):
+        super().__init__(daemon=True)
+        self.sid = f"loadtest-{sid}"
+        self.frames = frames
+        self.routes = routes
+        self.host, self.port = host, port
+        self.interval = 1.0 / fps
+        self.stop_at = stop_at
+        self.offset = random.randrange(len(frames))
+        self.jobs = queue.Queue()
+        self.lock = threading.Lock()
+        self.pool = [threading.Thread(target=self._worker, daemon=True) for _ in range(connections)]
+
+        self.latencies = {route: [] for route in routes}
+        self.errors = {route: 0 for route in routes}
+        self.busy = {route: 0 for route in routes}
+        self.skipped = {route: 0 for route in routes}
+        self.send_lag = []
+        self.sent = 0
+
+    def run(self):
+        for worker in self.pool:
+            worker.start()
+
+        scheduled = time.perf_counter() + random.random() * self.interval
+        i = self.offset
+        while scheduled < self.stop_at:
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            body = json.dumps({"landmarks": [float(v) for v in self.frames[i % len(self.frames)]]})
+            i += 1
+            for route in self.routes:
+                self.jobs.put((route, body, scheduled))
+            scheduled += self.interval
+
+        for _ in self.pool:
+            self.jobs.put(None)
+        for worker in self.pool:
+            worker.join()
+
+    def _worker(self):
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=10)
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            route, body, scheduled = job
+            sent = time.perf_counter()
+            try:
+                conn.request("POST", route, body, {
+                    "Content-Type": "application/json",
+                    "X-Session-Id": self.sid,
+                })
+                response = conn.getresponse()
+                payload = response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                status = None
+                conn.close()
+                conn = http.client.HTTPConnection(self.host, self.port, timeout=10)
+            elapsed = (time.perf_counter() - scheduled) * 1000.0
+
+            with self.lock:
+                self.sent += 1
+                self.send_lag.append((sent - scheduled) * 1000.0)
+                if status == 503:
+                    self.busy[route] += 1
+                elif status != 200:
+                    self.errors[route] += 1
+                elif b'"skipped"' in payload:
+                    # Superseded/coalesced by admission.py: answered, not run
+                    self.skipped[route] += 1
+                else:
+                    self.latencies[route].append(elapsed)
+        conn.close()
+
+
+def cpu_seconds(pid):
+    # utime + stime from /proc (Linux only)
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def tree_cpu_seconds(pid):
+    # {pid: seconds} for the server and every process under it, so
+    # `uvicorn --workers N` is counted in full, not just the parent
+    usage = {}
+    for p in [pid] + children(pid):
+        seconds = cpu_seconds(p)
+        if seconds is not None:
+            usage[p] = seconds
+    return usage
+
+
+def spawn_server(port):
+    env = dict(os.environ, ISL_TRANSLATOR="stub")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        try:
+            conn = http.client.HTTPConnection(HOST, port, timeout=2)
+            conn.request("GET", "/metrics")
+            conn.getresponse().read()
+            return proc
+        except OSError:
+            time.sleep(0.5)
+    proc.terminate()
+    raise RuntimeError("uvicorn did not become ready in time")
+
+
+def run(frames, routes, signers, fps, duration, host, port, server_pid=None, connections=CONNECTIONS):
+    stop_at = time.perf_counter() + duration
+    clients = [Signer(i, frames, routes, host, port, fps, stop_at, connections) for i in range(signers)]
+
+    cpu_start = tree_cpu_seconds(server_pid) if server_pid else None
+    start = time.perf_counter()
+    for c in clients:
+        c.start()
+    for c in clients:
+        c.join()
+    elapsed = time.perf_counter() - start
+    cpu_end = tree_cpu_seconds(server_pid) if server_pid else None
+
+    report = {
+        "signers": signers,
+        "target_fps": fps,
+        "connections_per_signer": connections,
+        "duration_s": round(elapsed, 2),
+        # Time frames waited for a free client connection; large values
+        # mean the client pool, not the server, is the bottleneck
+        "send_lag": summarize([v for c in clients for v in c.send_lag]),
+        "routes": {},
+    }
+    for route in routes:
+        latencies = [v for c in clients for v in c.latencies[route]]
+        errors = sum(c.errors[route] for c in clients)
+        busy = sum(c.busy[route] for c in clients)
+        skipped = sum(c.skipped[route] for c in clients)
+        total = len(latencies) + errors + busy + skipped
+        report["routes"][route] = {
+            "requests": total,
+            "throughput_rps": round(total / elapsed, 2),
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "busy_rate": round(busy / total, 4) if total else 0.0,
+            "skipped_rate": round(skipped / total, 4) if total else 0.0,
+            "latency": summarize(latencies),
+        }
+
+    if cpu_end:
+        # Summed over all server processes; 100% = one core busy
+        used = sum(seconds - cpu_start.get(p, 0.0) for p, seconds in cpu_end.items())
+        report["server_cpu_percent"] = round(used / elapsed * 100.0, 1)
+        report["server_processes"] = len(cpu_end)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded signers against the API")
+    parser.add_argument("--source", default=SOURCE)
+    parser.add_argument("--routes", default=",".join(ROUTES))
+    parser.add_argument("--signers", type=int, default=SIGNERS)
+    parser.add_argument("--fps", type=float, default=FPS)
+    parser.add_argument("--connections", type=int, default=CONNECTIONS,
+                        help="concurrent connections per signer")
+    parser.add_argument("--duration", type=float, default=DURATION)
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--spawn", action="store_true",
+                        help="start a local uvicorn with the stub translator")
+    parser.add_argument("--server-pid", type=int, default=None,
+                        help="pid of an already running server, for CPU usage")
+    parser.add_argument("--report", default=REPORT_PATH)
+    args = parser.parse_args()
+
+    frames = load_landmark_stream(args.source)
+    if not frames:
+        raise ValueError("No landmark frames found!")
+    routes = [r.strip() for r in args.routes.split(",") if r.strip()]
+
+    proc = spawn_server(args.port) if args.spawn else None
+    try:
+        pid = proc.pid if proc else args.server_pid
+        report = run(frames, routes, args.signers, args.fps, args.duration,
+                     args.host, args.port, server_pid=pid, connections=args.connections)
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+
+    with open(args.report, "w") as f:
+        json.dump(report, f, indent=4)
+
+    print(f"👥 Signers: {report['signers']} @ {report['target_fps']} fps | "
+          f"send lag p95: {report['send_lag'].get('p95_ms', 0.0):.1f} ms")
+    for route, r in report["routes"].items():
+        lat = r["latency"]
+        if lat["count"]:
+            print(f"  {route:<16} {r['throughput_rps']:>8.1f} req/s | p50 {lat['p50_ms']:.1f} ms | "
+                  f"p95 {lat['p95_ms']:.1f} ms | p99 {lat['p99_ms']:.1f} ms | skipped {r['skipped_rate'] * 100:.1f}% | "
+                  f"busy {r['busy_rate'] * 100:.1f}% | errors {r['error_rate'] * 100:.2f}%")
+        else:
+            print(f"  {route:<16} no successful requests | errors {r['error_rate'] * 100:.2f}%")
+    if "server_cpu_percent" in report:
+        print(f"🖥️ Server CPU: {report['server_cpu_percent']}%")
+    print(f"📁 Report saved at: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import json
+import time
+import argparse
+import profiling
+from src.benchmark.sources import open_source
+from src.benchmark.timing import StageTimer
+
+# ================= CONFIG =================
+# Run from the backend folder, e.g.
+#   python -m src.benchmark.replay --source word/data/word_sequences --pace max
+MODELS = ("alphabet", "word")
+REPORT_PATH = "bench_report.json"
+# ==========================================
+
+
+def load_predictors(models):
+    predictors = {}
+    if "alphabet" in models:
+        from inference import predict_landmarks
+        predictors["alphabet"] = predict_landmarks
+    if "word" in models:
+        from word.word_inference import predict_word
+        predictors["word"] = predict_word
+    return predictors
+
+
+def replay(source, predictors, pace="max", frame_skip=1, timer=None, tracker=None):
+    timer = timer or StageTimer()
+
+    if source.needs_tracking and tracker is None:
+        from src.hand_tracking.mediapipe_hand import HandTracker
+        tracker = HandTracker()
+
+    frame_interval = 1.0 / source.fps
+    predictions = []
+    frame_count = 0
+    start = time.perf_counter()
+
+    for frame, landmarks in source.frames():
+        frame_start = time.perf_counter()
+        frame_count += 1
+
+        if landmarks is None:
+            with timer.time("tracking"):
+                landmarks, _, _ = tracker.find_hand_landmarks(frame, draw=False)
+
+        if frame_count % frame_skip == 0:
+            for name, predict in predictors.items():
+                with timer.time(name), profiling.profiled(f"replay_{name}"):
+                    label, confidence = predict(landmarks)
+                if label is not None:
+                    predictions.append({
+                        "frame": frame_count,
+                        "time_s": round(time.perf_counter() - start, 4),
+                        "model": name,
+                        "label": label,
+                        "confidence": round(float(confidence), 4),
+                    })
+
+        timer.add("frame", (time.perf_counter() - frame_start) * 1000.0)
+
+        if pace == "realtime":
+            # Hold to the source frame rate, like a live camera would
+            target = start + frame_count * frame_interval
+            delay = target - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "source": str(source.path),
+        "pace": pace,
+        "frames": frame_count,
+        "elapsed_s": round(elapsed, 3),
+        "fps": round(frame_count / elapsed, 2) if elapsed > 0 else 0.0,
+        "source_fps": source.fps,
+        "stages": timer.report(),
+        "predictions": predictions,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless replay benchmark")
+    parser.add_argument("--source", required=True,
+                        help="video file, camera index, .npy/.csv landmarks or sequence folder")
+    parser.add_argument("--pace", choices=["max", "realtime"], default="max")
+    parser.add_argument("--fps", type=float, default=None,
+                        help="playback rate for landmark streams")
+    parser.add_argument("--models", default=",".join(MODELS))
+    parser.add_argument("--frame-skip", type=int, default=1)
+    parser.add_argument("--report", default=REPORT_PATH)
+    parser.add_argument("--profile-rate", type=float, default=None,
+                        help="fraction of predictions to profile (see profiling.py)")
+    args = parser.parse_args()
+
+    if args.profile_rate is not None:
+        profiling.configure(rate=args.profile_rate)
+
+    models = [m.strip() for m in args.models.split(",") if m.strip()]
+    predictors = load_predictors(models)
+    source = open_source(args.source, fps=args.fps)
+
+    report = replay(source, predictors, pace=args.pace, frame_skip=args.frame_skip)
+
+    with open(args.report, "w") as f:
+        json.dump(report, f, indent=4)
+
+    print(f"🎞️ Frames: {report['frames']} | ⚡ FPS: {report['fps']}")
+    for stage, summary in report["stages"].items():
+        if summary["count"]:
+            print(f"  {stage:<10} p50 {summary['p50_ms']:.2f} ms | "
+                  f"p95 {summary['p95_ms']:.2f} ms | p99 {summary['p99_ms']:.2f} ms")
+    print("🔤 Predictions:", " ".join(p["label"] for p in report["predictions"]))
+    print(f"📁 Report saved at: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import os
+import csv
+import cv2
+import numpy as np
+
+FEATURES = 126
+DEFAULT_FPS = 30.0
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".webm")
+
+# Empty frames inserted between recorded word sequences so that
+# hand-drop segmentation sees the same gap it would on a live camera.
+GAP_FRAMES = 10
+
+
+def pad_landmarks(row):
+    row = np.asarray(row, dtype=np.float32).reshape(-1)
+    if row.size < FEATURES:
+        row = np.concatenate([row, np.zeros(FEATURES - row.size, dtype=np.float32)])
+    return row[:FEATURES]
+
+
+class VideoSource:
+    needs_tracking = True
+
+    def __init__(self, path):
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise FileNotFoundError(f"Cannot open video source: {path}")
+
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        self.fps = fps if fps and fps > 0 else DEFAULT_FPS
+
+    def frames(self):
+        try:
+            while True:
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+                yield frame, None
+        finally:
+            self.cap.release()
+
+
+class LandmarkSource:
+    needs_tracking = False
+
+    def __init__(self, path, fps=DEFAULT_FPS):
+        self.path = path
+        self.fps = fps
+        self.rows = load_landmark_stream(path)
+
+    def frames(self):
+        for row in self.rows:
+            yield None, row
+
+
+def load_landmark_stream(path):
+    if os.path.isdir(path):
+        return _load_sequence_dir(path)
+    if path.endswith(".npy"):
+        return _load_npy(path)
+    if path.endswith(".csv"):
+        return _load_csv(path)
+    raise ValueError(f"Unsupported landmark stream: {path}")
+
+
+def _load_npy(path):
+    seq = np.load(path)
+    if seq.ndim == 1:
+        seq = seq.reshape(1, -1)
+    return [pad_landmarks(row) for row in seq]
+
+
+def _load_csv(path):
+    rows = []
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        for record in reader:
+            rows.append(pad_landmarks([float(v) for v in record[:FEATURES]]))
+    return rows
+
+
+def _load_sequence_dir(path):
+    # Accepts either a single word folder (0.npy, 1.npy, ...) or the
+    # dataset root (WORD/0.npy, ...); sequences are played back to back.
+    files = []
+    for root, _, names in os.walk(path):
+        for name in names:
+            if name.endswith(".npy"):
+                files.append(os.path.join(root, name))
+
+    def sort_key(p):
+        stem = os.path.splitext(os.path.basename(p))[0]
+        return (os.path.dirname(p), int(stem) if stem.isdigit() else stem)
+
+    gap = [np.zeros(FEATURES, dtype=np.float32)] * GAP_FRAMES
+    rows = []
+    for file in sorted(files, key=sort_key):
+        rows.extend(_load_npy(file))
+        rows.extend(gap)
+    return rows
+
+
+def open_source(source, fps=None):
+    if isinstance(source, int) or str(source).isdigit():
+        return VideoSource(int(source))
+    if str(source).lower().endswith(VIDEO_EXTENSIONS):
+        return VideoSource(source)
+    return LandmarkSource(source, fps=fps or DEFAULT_FPS)
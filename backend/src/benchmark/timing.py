@@ -0,0 +1,48 @@
+import time
+import numpy as np
+from collections import defaultdict
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def summarize(samples_ms):
+    if not samples_ms:
+        return {"count": 0}
+
+    arr = np.asarray(samples_ms, dtype=np.float64)
+    summary = {
+        "count": int(arr.size),
+        "mean_ms": round(float(arr.mean()), 3),
+        "max_ms": round(float(arr.max()), 3),
+    }
+    for p, value in zip(PERCENTILES, np.percentile(arr, PERCENTILES)):
+        summary[f"p{p}_ms"] = round(float(value), 3)
+    return summary
+
+
+class StageTimer:
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    def time(self, stage):
+        return _Span(self, stage)
+
+    def add(self, stage, elapsed_ms):
+        self.samples[stage].append(elapsed_ms)
+
+    def report(self):
+        return {stage: summarize(values) for stage, values in self.samples.items()}
+
+
+class _Span:
+    def __init__(self, timer, stage):
+        self.timer = timer
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.add(self.stage, (time.perf_counter() - self.start) * 1000.0)
+        return False
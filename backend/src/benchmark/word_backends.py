@@ -0,0 +1,116 @@
+import os
+import json
+import time
+import argparse
+import numpy as np
+from model_registry import load_bundle
+from src.benchmark.holdout import is_holdout_file
+from src.benchmark.timing import summarize
+from word.sequence import prepare
+
+# ================= CONFIG =================
+# Run from the backend folder: python -m src.benchmark.word_backends
+DATA_DIR = "word/data/word_sequences"
+SEQUENCE_LENGTH = 20
+FEATURES = 126
+BACKENDS = {
+    "keras": ("word/models/word_model.h5", "word/models/word_label_map.json"),
+    "mmap": ("models/shared/word", "word/models/word_label_map.json"),
+    "torch": ("word/word_lstm_model.pth", "word/word_labels.json"),
+}
+SINGLE_RUNS = 200
+BATCH_SIZE = 32
+BATCH_RUNS = 20
+REPORT_PATH = "word_backends_report.json"
+# ==========================================
+
+
+def load_dataset():
+    X, y = [], []
+    for word in sorted(os.listdir(DATA_DIR)):
+        path = os.path.join(DATA_DIR, word)
+        if not os.path.isdir(path):
+            continue
+        for file in sorted(os.listdir(path)):
+            # Held-out sequences only, so accuracy isn't measured on training data
+            if file.endswith(".npy") and is_holdout_file(os.path.join(path, file)):
+                seq = prepare(np.load(os.path.join(path, file)), SEQUENCE_LENGTH)
+                if seq is not None:
+                    X.append(seq)
+                    y.append(word)
+    return np.array(X, dtype=np.float32), y
+
+
+def accuracy(bundle, X, y):
+    # Folder names and label maps differ in case (HELLO vs Hello); only
+    # classes the model knows are scored.
+    index = {v.lower(): k for k, v in bundle.label_map.items()}
+    keep = [i for i, label in enumerate(y) if label.lower() in index]
+    if not keep:
+        return None, 0
+    probs = bundle.predict(X[keep])
+    pred = np.argmax(probs, axis=1)
+    true = np.array([index[y[i].lower()] for i in keep])
+    return round(float((pred == true).mean()), 4), len(keep)
+
+
+def benchmark(name, model_path, label_map_path, X, y):
+    start = time.perf_counter()
+    spec = {"input_shape": [SEQUENCE_LENGTH, FEATURES], "backend": name}
+    bundle = load_bundle("word", name, model_path, label_map_path, spec)
+    load_s = time.perf_counter() - start
+
+    single = []
+    for i in range(SINGLE_RUNS):
+        x = X[i % len(X)][None, ...]
+        t = time.perf_counter()
+        bundle.predict(x)
+        single.append((time.perf_counter() - t) * 1000.0)
+
+    batch = X[:BATCH_SIZE]
+    t = time.perf_counter()
+    for _ in range(BATCH_RUNS):
+        bundle.predict(batch)
+    batch_s = time.perf_counter() - t
+
+    acc, scored = accuracy(bundle, X, y)
+    return {
+        "load_s": round(load_s, 3),
+        "single_sample": summarize(single),
+        "batched_throughput_seq_per_s": round(BATCH_RUNS * len(batch) / batch_s, 1),
+        "accuracy": acc,
+        "scored_sequences": scored,
+        "classes": len(bundle.label_map),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare word model backends on CPU")
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--report", default=REPORT_PATH)
+    args = parser.parse_args()
+
+    X, y = load_dataset()
+    if len(X) == 0:
+        raise ValueError("No data found!")
+
+    report = {}
+    for name in [b.strip() for b in args.backends.split(",") if b.strip()]:
+        model_path, label_map_path = BACKENDS[name]
+        try:
+            report[name] = benchmark(name, model_path, label_map_path, X, y)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"⚠ Skipping {name}: {e}")
+            continue
+        r = report[name]
+        print(f"  {name:<6} p50 {r['single_sample']['p50_ms']:.2f} ms | p95 "
+              f"{r['single_sample']['p95_ms']:.2f} ms | {r['batched_throughput_seq_per_s']} seq/s | "
+              f"acc {r['accuracy']} on {r['scored_sequences']} seqs ({r['classes']} classes)")
+
+    with open(args.report, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"📁 Report saved at: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
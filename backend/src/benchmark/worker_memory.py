@@ -0,0 +1,124 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import http.client
+
+# ================= CONFIG =================
+# Run from the backend folder (after `python -m shared_weights`):
+#   python -m src.benchmark.worker_memory --workers 4
+PORT = 8010
+WORKERS = 4
+MODES = ("keras", "mmap")
+SETTLE_SECONDS = 10.0     # give every worker time to finish loading models
+REPORT_PATH = "memory_report.json"
+# ==========================================
+
+
+def children(pid):
+    found = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        if ppid == pid:
+            found.append(int(entry))
+            found.extend(children(int(entry)))
+    return found
+
+
+def memory_kb(pid):
+    # Pss splits shared pages between the processes mapping them, so the
+    # sum over workers is the real cost; Rss counts shared pages in full.
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:", "Shared_Clean:", "Private_Dirty:"):
+                values[parts[0][:-1].lower()] = int(parts[1])
+    return values
+
+
+def is_worker(pid):
+    try:
+        with open(f"/proc/{pid}/cmdline") as f:
+            cmd = f.read()
+    except OSError:
+        return False
+    # Skip the multiprocessing resource tracker, keep the spawned workers
+    return "resource_tracker" not in cmd
+
+
+def wait_ready(port, proc, timeout=300):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/metrics")
+            conn.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError("uvicorn did not become ready in time")
+
+
+def measure(mode, workers, port):
+    env = dict(os.environ, ISL_MODEL_BACKEND=mode, ISL_TRANSLATOR="stub")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        wait_ready(port, proc)
+        time.sleep(SETTLE_SECONDS)
+        pids = [p for p in children(proc.pid) if is_worker(p)]
+        per_worker = [memory_kb(p) for p in pids]
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    n = len(per_worker) or 1
+    return {
+        "workers": len(per_worker),
+        "rss_mb_per_worker": round(sum(w["rss"] for w in per_worker) / n / 1024, 1),
+        "pss_mb_per_worker": round(sum(w["pss"] for w in per_worker) / n / 1024, 1),
+        "pss_mb_total": round(sum(w["pss"] for w in per_worker) / 1024, 1),
+        "shared_clean_mb_per_worker": round(sum(w.get("shared_clean", 0) for w in per_worker) / n / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resident memory per uvicorn worker")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--report", default=REPORT_PATH)
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        raise SystemExit("This measurement needs Linux /proc/<pid>/smaps_rollup")
+
+    report = {}
+    for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+        print(f"⏳ Measuring {mode} with {args.workers} workers...")
+        report[mode] = measure(mode, args.workers, args.port)
+        r = report[mode]
+        print(f"  {mode:<6} RSS/worker {r['rss_mb_per_worker']} MB | PSS/worker "
+              f"{r['pss_mb_per_worker']} MB | PSS total {r['pss_mb_total']} MB")
+
+    with open(args.report, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"📁 Report saved at: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import os
+import csv
+import time
+import queue
+import threading
+import numpy as np
+
+# ================= CONFIG =================
+BATCH_SIZE = 64          # rows written per batch
+FLUSH_INTERVAL = 0.5     # seconds between batch writes
+FSYNC_INTERVAL = 2.0     # seconds between fsyncs
+# ==========================================
+
+_STOP = object()
+
+
+class AsyncWriter:
+    # Moves disk I/O off the capture loop: put() only enqueues, a
+    # background thread batches writes and fsyncs periodically.
+
+    def __init__(self, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL,
+                 fsync_interval=FSYNC_INTERVAL):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+
+        self.queue = queue.Queue()
+        self.written = 0
+        self.max_lag = 0.0
+        self.error = None
+        self._last_fsync = time.monotonic()
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def put(self, item):
+        if self.error is not None:
+            raise RuntimeError("Background writer failed") from self.error
+        self.queue.put((time.monotonic(), item))
+
+    def lag(self):
+        return {
+            "queued": self.queue.qsize(),
+            "written": self.written,
+            "max_lag_s": round(self.max_lag, 3),
+        }
+
+    def close(self):
+        self.queue.put(_STOP)
+        self.thread.join()
+        if self.error is not None:
+            raise RuntimeError("Background writer failed") from self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _run(self):
+        batch = []
+        stopping = False
+        deadline = time.monotonic() + self.flush_interval
+
+        while not stopping:
+            try:
+                entry = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                if entry is _STOP:
+                    stopping = True
+                else:
+                    batch.append(entry)
+            except queue.Empty:
+                pass
+
+            if batch and (stopping or len(batch) >= self.batch_size
+                          or time.monotonic() >= deadline):
+                self._flush(batch)
+                batch = []
+
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+
+        self._sync(force=True)
+        self._finish()
+
+    def _flush(self, batch):
+        try:
+            self.write_batch([item for _, item in batch])
+        except Exception as e:
+            self.error = e
+            return
+        now = time.monotonic()
+        self.max_lag = max(self.max_lag, now - batch[0][0])
+        self.written += len(batch)
+        self._sync()
+
+    def _sync(self, force=False):
+        now = time.monotonic()
+        if force or now - self._last_fsync >= self.fsync_interval:
+            try:
+                self.sync()
+            except Exception as e:
+                self.error = e
+            self._last_fsync = now
+
+    # -------- subclass hooks --------
+    def write_batch(self, items):
+        raise NotImplementedError
+
+    def sync(self):
+        pass
+
+    def _finish(self):
+        pass
+
+
+class CsvAppendWriter(AsyncWriter):
+    def __init__(self, path, header=None, mode="a", **kwargs):
+        if mode == "a":
+            _repair_partial_line(path)
+        new_file = mode == "w" or not os.path.isfile(path) or os.path.getsize(path) == 0
+
+        self.file = open(path, mode, newline="")
+        self.writer = csv.writer(self.file)
+        if header is not None and new_file:
+            self.writer.writerow(header)
+            self.file.flush()
+
+        super().__init__(**kwargs)
+
+    def write_batch(self, rows):
+        self.writer.writerows(rows)
+        self.file.flush()
+
+    def sync(self):
+        os.fsync(self.file.fileno())
+
+    def _finish(self):
+        self.file.close()
+
+
+class NpyWriter(AsyncWriter):
+    # Items are (path, array). Each file is written to a temp name and
+    # renamed, so a crash never leaves a truncated .npy behind.
+
+    def write_batch(self, items):
+        for path, array in items:
+            tmp_path = path + ".partial"
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.asarray(array))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+
+
+def _repair_partial_line(path):
+    # Drop a half-written last row left behind by a crash
+    if not os.path.isfile(path) or os.path.getsize(path) == 0:
+        return
+    with open(path, "rb+") as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) == b"\n":
+            return
+        f.seek(0)
+        data = f.read()
+        f.truncate(data.rfind(b"\n") + 1)
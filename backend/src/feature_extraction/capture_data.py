@@ -1,9 +1,9 @@
 import cv2
-import csv
 import string
 import os
 import time
 from src.hand_tracking.mediapipe_hand import HandTracker
+from src.feature_extraction.async_writer import CsvAppendWriter
 
 # ================= CONFIG =================
 CSV_PATH = "data/landmarks/alphabet_number_landmarks_2hand.csv"
@@ -20,10 +20,10 @@ os.makedirs("data/landmarks", exist_ok=True)
 tracker = HandTracker(static_mode=True)
 cap = cv2.VideoCapture(CAMERA_INDEX)
 
-with open(CSV_PATH, mode="w", newline="") as f:
-    writer = csv.writer(f)
-    header = [f"f{i}" for i in range(126)] + ["label"]
-    writer.writerow(header)
+header = [f"f{i}" for i in range(126)] + ["label"]
+
+# Rows are written by a background thread so disk stalls don't drop frames
+with CsvAppendWriter(CSV_PATH, header=header, mode="w") as writer:
 
     print("📸 ISL DATA COLLECTION STARTED")
 
@@ -42,7 +42,7 @@ with open(CSV_PATH, mode="w", newline="") as f:
             landmarks, hand_present, frame = tracker.find_hand_landmarks(frame)
 
             if hand_present:
-                writer.writerow(landmarks + [label])
+                writer.put(landmarks + [label])
                 collected += 1
 
                 cv2.putText(
@@ -65,6 +65,16 @@ with open(CSV_PATH, mode="w", newline="") as f:
                     2
                 )
 
+            cv2.putText(
+                frame,
+                f"Writer queue: {writer.queue.qsize()}",
+                (20, 90),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.6,
+                (200, 200, 200),
+                1
+            )
+
             cv2.imshow("ISL Data Capture", frame)
 
             if cv2.waitKey(1) & 0xFF == 27:  # ESC
@@ -73,5 +83,6 @@ with open(CSV_PATH, mode="w", newline="") as f:
 cap.release()
 cv2.destroyAllWindows()
 
+print(f"🧾 Writer: {writer.lag()}")
 print("\n✅ Data collection completed successfully!")
 print(f"📁 Saved at: {CSV_PATH}")
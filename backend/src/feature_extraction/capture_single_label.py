@@ -1,9 +1,9 @@
 import cv2
-import csv
 import os
 import time
 import pandas as pd
 from src.hand_tracking.mediapipe_hand import HandTracker
+from src.feature_extraction.async_writer import CsvAppendWriter
 
 # ================= CONFIG =================
 CSV_PATH = "data/landmarks/alphabet_number_landmarks_2hand.csv"
@@ -43,8 +43,7 @@ print(f"📁 Dataset cleaned. Now collecting fresh samples for '{LABEL}'")
 tracker = HandTracker(static_mode=True)
 cap = cv2.VideoCapture(CAMERA_INDEX)
 
-with open(CSV_PATH, mode="a", newline="") as f:
-    writer = csv.writer(f)
+with CsvAppendWriter(CSV_PATH) as writer:
 
     print("⏳ Starting in 3 seconds...")
     time.sleep(3)
@@ -59,7 +58,7 @@ with open(CSV_PATH, mode="a", newline="") as f:
         landmarks, hand_present, frame = tracker.find_hand_landmarks(frame)
 
         if hand_present:
-            writer.writerow(landmarks + [LABEL])
+            writer.put(landmarks + [LABEL])
             collected += 1
 
             cv2.putText(
@@ -82,6 +81,16 @@ with open(CSV_PATH, mode="a", newline="") as f:
                 2
             )
 
+        cv2.putText(
+            frame,
+            f"Writer queue: {writer.queue.qsize()}",
+            (20, 90),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.6,
+            (200, 200, 200),
+            1
+        )
+
         cv2.imshow("Replace Label Capture", frame)
 
         if cv2.waitKey(1) & 0xFF == 27:  # ESC
@@ -90,5 +99,6 @@ with open(CSV_PATH, mode="a", newline="") as f:
 cap.release()
 cv2.destroyAllWindows()
 
+print(f"🧾 Writer: {writer.lag()}")
 print(f"\n✅ '{LABEL}' now has exactly {TARGET_SAMPLES_PER_LABEL} samples")
 print("🎯 Dataset is balanced for this label")
@@ -1,13 +1,14 @@
 import cv2
-import json
 import numpy as np
-from tensorflow.keras.models import load_model
 from collections import deque
 from src.hand_tracking.mediapipe_hand import HandTracker
+from model_registry import registry
 
 # ================= CONFIG =================
 MODEL_PATH = "models/alphabet_number_model.h5"
 LABEL_MAP_PATH = "models/label_map.json"
+MODEL_VERSION = "v1"
+FEATURE_SPEC = {"input_shape": [126], "backend": "keras"}
 
 CONFIDENCE_THRESHOLD = 0.88
 SMOOTHING_WINDOW = 4
@@ -15,13 +16,8 @@ FRAME_SKIP = 3
 CAMERA_INDEX = 0
 # ==========================================
 
-# Load model
-model = load_model(MODEL_PATH)
-
-# Load label map
-with open(LABEL_MAP_PATH, "r") as f:
-    label_map = json.load(f)
-label_map = {int(k): v for k, v in label_map.items()}
+# Load model + label map (warmed up before the camera opens)
+registry.ensure("alphabet", MODEL_VERSION, MODEL_PATH, LABEL_MAP_PATH, FEATURE_SPEC)
 
 tracker = HandTracker()
 cap = cv2.VideoCapture(CAMERA_INDEX)
@@ -50,7 +46,8 @@ while True:
 
         input_data = np.array(landmarks, dtype=np.float32).reshape(1, -1)
 
-        probs = model.predict(input_data, verbose=0)[0]
+        bundle = registry.get("alphabet")
+        probs = bundle.predict(input_data)[0]
         pred_idx = int(np.argmax(probs))
         confidence = probs[pred_idx]
 
@@ -58,7 +55,7 @@ while True:
             prediction_queue.append(pred_idx)
 
             if prediction_queue.count(pred_idx) > SMOOTHING_WINDOW // 2:
-                char = label_map[pred_idx]
+                char = bundle.label_map[pred_idx]
                 if char != last_char:
                     output_text += char
                     last_char = char
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 import json
 import os
+import sys
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
 from tensorflow.keras.models import Sequential
@@ -9,6 +10,10 @@ from tensorflow.keras.layers import Dense, Dropout
 from tensorflow.keras.utils import to_categorical
 from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from profiling import profiled
+from src.benchmark.holdout import holdout_mask
+
 # ================= CONFIG =================
 CSV_PATH = "../../data/landmarks/alphabet_number_landmarks_2hand.csv"
 MODEL_PATH = "models/alphabet_number_model.h5"
@@ -31,6 +36,11 @@ if df.shape[0] == 0:
 X = df.iloc[:, :-1].values          # 126 landmark features
 y = df.iloc[:, -1].astype(str)      # 🔥 FORCE labels to string
 
+# Keep the fixed evaluation split (src/benchmark/evaluate.py) out of training
+held_out = holdout_mask(y)
+X, y = X[~held_out], y[~held_out]
+print(f"Held out {int(held_out.sum())} rows for evaluation")
+
 # Encode labels
 label_encoder = LabelEncoder()
 y_encoded = label_encoder.fit_transform(y)
@@ -67,12 +77,14 @@ model.compile(
 )
 
 # Train
-model.fit(
-    X_train, y_train,
-    validation_data=(X_test, y_test),
-    epochs=EPOCHS,
-    batch_size=BATCH_SIZE
-)
+# ISL_PROFILE_RATE=1 dumps a profile of the training run
+with profiled("train_alphabet"):
+    model.fit(
+        X_train, y_train,
+        validation_data=(X_test, y_test),
+        epochs=EPOCHS,
+        batch_size=BATCH_SIZE
+    )
 
 # Save model
 model.save(MODEL_PATH)
@@ -0,0 +1,52 @@
+import numpy as np
+
+# ================= CONFIG =================
+# Matches the state dict in word/word_lstm_model.pth:
+# 2-layer LSTM(126 -> 128) -> Linear(128, 64) -> ReLU -> Dropout -> Linear(64, classes)
+# The weights load, but score at chance on word/data (see README): they
+# were trained on preprocessing this repo does not have.
+FEATURES = 126
+HIDDEN = 128
+LAYERS = 2
+FC_HIDDEN = 64
+# ==========================================
+
+
+def _build(num_classes):
+    import torch.nn as nn
+
+    class WordLSTM(nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.lstm = nn.LSTM(FEATURES, HIDDEN, num_layers=LAYERS, batch_first=True)
+            self.fc = nn.Sequential(
+                nn.Linear(HIDDEN, FC_HIDDEN),
+                nn.ReLU(),
+                nn.Dropout(0.3),
+                nn.Linear(FC_HIDDEN, num_classes),
+            )
+
+        def forward(self, x):
+            out, _ = self.lstm(x)
+            return self.fc(out[:, -1])
+
+    return WordLSTM()
+
+
+class TorchModel:
+    # Same predict() contract as a Keras model: numpy in, softmax probs out
+
+    def __init__(self, path):
+        import torch
+        self.torch = torch
+
+        state = torch.load(path, map_location="cpu", weights_only=True)
+        num_classes = state["fc.3.weight"].shape[0]
+        self.net = _build(num_classes)
+        self.net.load_state_dict(state)
+        self.net.eval()
+
+    def predict(self, x, verbose=0):
+        with self.torch.inference_mode():
+            logits = self.net(self.torch.from_numpy(np.ascontiguousarray(x, dtype=np.float32)))
+            return self.torch.softmax(logits, dim=-1).numpy()
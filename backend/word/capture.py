@@ -1,9 +1,13 @@
 import os
+import sys
 import cv2
 import time
 import numpy as np
 import mediapipe as mp
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.feature_extraction.async_writer import NpyWriter
+
 # ================= CONFIG =================
 DATA_DIR = "data/word_sequences"
 SEQUENCE_LENGTH = 20
@@ -24,6 +28,9 @@ hands = mp_hands.Hands(
 
 cap = cv2.VideoCapture(0)
 
+# Samples are saved by a background thread so the camera loop never waits on disk
+writer = NpyWriter()
+
 def get_landmarks(results):
     if not results.multi_hand_landmarks or not results.multi_handedness:
         return None
@@ -97,10 +104,10 @@ while sample_count < SAMPLES_PER_WORD:
                 recording = False
 
                 if len(sequence) == SEQUENCE_LENGTH:
-                    np.save(
+                    writer.put((
                         os.path.join(word_path, f"{sample_count}.npy"),
                         np.array(sequence)
-                    )
+                    ))
                     sample_count += 1
                     print(f"✅ Saved {word} {sample_count}/{SAMPLES_PER_WORD}")
                 else:
@@ -117,6 +124,8 @@ while sample_count < SAMPLES_PER_WORD:
     if cv2.waitKey(1) & 0xFF == 27:
         break
 
+writer.close()
+print(f"🧾 Writer: {writer.lag()}")
 print(f"\n✔ Completed {word}")
 cap.release()
 cv2.destroyAllWindows()
@@ -1,14 +1,18 @@
 import os
+import sys
 import cv2
 import time
 import numpy as np
 import mediapipe as mp
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.feature_extraction.async_writer import NpyWriter
+from word.sequence import MIN_FRAMES, to_two_hands
+
 # ================= CONFIG =================
 DATA_DIR = "data/word_sequences"
 WORDS = ["HELLO", "YES", "NO", "THANKYOU", "PLEASE","BYE","FOOD","GOODMORNING","SORRY","WATER"]
 
-SEQUENCE_LENGTH = 30
 SAMPLES_PER_WORD = 60
 HAND_ABSENCE_TIME = 2.0  # seconds (YOUR REQUIREMENT)
 # =========================================
@@ -25,6 +29,9 @@ hands = mp_hands.Hands(
 
 cap = cv2.VideoCapture(0)
 
+# Samples are saved by a background thread so the camera loop never waits on disk
+writer = NpyWriter()
+
 for word in WORDS:
     word_path = os.path.join(DATA_DIR, word)
     os.makedirs(word_path, exist_ok=True)
@@ -71,13 +78,13 @@ for word in WORDS:
                 if time.time() - last_hand_time >= HAND_ABSENCE_TIME:
                     recording = False
 
-                    if len(sequence) >= SEQUENCE_LENGTH:
-                        sequence = sequence[:SEQUENCE_LENGTH]
-
+                    if len(sequence) >= MIN_FRAMES:
                         save_path = os.path.join(
                             word_path, f"{sample_count}.npy"
                         )
-                        np.save(save_path, np.array(sequence))
+                        # Whole gesture, stored as frames × 126 like capture.py;
+                        # train.py resamples (word/sequence.py)
+                        writer.put((save_path, to_two_hands(np.array(sequence))))
                         sample_count += 1
 
                         print(f"✅ Saved {word} sample {sample_count}/{SAMPLES_PER_WORD}")
@@ -105,5 +112,8 @@ for word in WORDS:
 
     print(f"✔ Completed {word}")
 
+writer.close()
+print(f"🧾 Writer: {writer.lag()}")
+
 cap.release()
 cv2.destroyAllWindows()
@@ -0,0 +1,104 @@
+import os
+import json
+import random
+import numpy as np
+from word.spotter import SignSpotter, FEATURES
+from src.benchmark.holdout import is_holdout_file
+
+# ================= CONFIG =================
+# Run from the backend folder: python -m word.evaluate_spotting
+DATA_DIR = "word/data/word_sequences"
+MODEL_PATH = "word/models/word_model.h5"
+LABEL_MAP_PATH = "word/models/word_label_map.json"
+
+SENTENCES = 50
+WORDS_PER_SENTENCE = (2, 5)
+HOLD_FRAMES = 6         # short static hold between words, hands stay up
+END_GAP_FRAMES = 10     # hands dropped after the sentence
+SEED = 42
+# =========================================
+
+
+def load_sequences(label_map):
+    by_name = {v.lower(): v for v in label_map.values()}
+    sequences = {}
+    for folder in sorted(os.listdir(DATA_DIR)):
+        label = by_name.get(folder.lower())
+        path = os.path.join(DATA_DIR, folder)
+        if label is None or not os.path.isdir(path):
+            continue
+        for file in sorted(os.listdir(path)):
+            # Sentences are stitched from held-out sequences only
+            if file.endswith(".npy") and is_holdout_file(os.path.join(path, file)):
+                seq = np.load(os.path.join(path, file)).astype(np.float32)
+                if seq.ndim == 2 and seq.shape[1] == FEATURES:
+                    sequences.setdefault(label, []).append(seq)
+    return sequences
+
+
+def build_sentence(sequences, rng):
+    words = rng.sample(sorted(sequences), rng.randint(*WORDS_PER_SENTENCE))
+    frames, word_ends = [], []
+    for word in words:
+        seq = rng.choice(sequences[word])
+        frames.extend(seq)
+        word_ends.append(len(frames) - 1)
+        frames.extend([seq[-1]] * HOLD_FRAMES)
+    frames.extend([np.zeros(FEATURES, dtype=np.float32)] * END_GAP_FRAMES)
+    return words, word_ends, frames
+
+
+def edit_distance(a, b):
+    d = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        prev, d[0] = d[0], i
+        for j in range(1, len(b) + 1):
+            cur = d[j]
+            d[j] = min(d[j] + 1, d[j - 1] + 1, prev + (a[i - 1] != b[j - 1]))
+            prev = cur
+    return d[len(b)]
+
+
+def main():
+    from tensorflow.keras.models import load_model
+
+    model = load_model(MODEL_PATH)
+    with open(LABEL_MAP_PATH) as f:
+        label_map = {int(k): v for k, v in json.load(f).items()}
+
+    sequences = load_sequences(label_map)
+    if not sequences:
+        raise ValueError("No usable word sequences found!")
+
+    spotter = SignSpotter(lambda x: model.predict(x, verbose=0)[0], label_map)
+    rng = random.Random(SEED)
+
+    errors = total_words = 0
+    latencies = []
+
+    for _ in range(SENTENCES):
+        words, word_ends, frames = build_sentence(sequences, rng)
+        spotter.reset()
+
+        emitted = []
+        for i, frame in enumerate(frames):
+            word, _ = spotter.push(frame)
+            if word is not None:
+                emitted.append(word)
+                # Latency = frames after the nearest preceding word end
+                ends = [e for e in word_ends if e <= i]
+                if ends:
+                    latencies.append(i - ends[-1])
+
+        errors += edit_distance(words, emitted)
+        total_words += len(words)
+
+    lat = np.array(latencies) if latencies else np.zeros(1)
+    print(f"📊 Sentences: {SENTENCES} | Words: {total_words}")
+    print(f"🎯 Word error rate: {errors / total_words * 100:.2f}%")
+    print(f"⏱️ Emission latency (frames after word end): "
+          f"p50 {np.percentile(lat, 50):.1f} | p95 {np.percentile(lat, 95):.1f} | max {lat.max():.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,22 @@
+import os
+import sys
 import cv2
 import json
-import numpy as np
 import mediapipe as mp
-from collections import deque
 from tensorflow.keras.models import load_model
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from word.spotter import SignSpotter
 
 MODEL_PATH = "models/word_model.h5"
 LABEL_MAP_PATH = "models/word_label_map.json"
 
-SEQUENCE_LENGTH = 20
 FEATURES = 126
 
 CONFIDENCE_THRESHOLD = 0.85
-SMOOTHING_WINDOW = 3
 
 model = load_model(MODEL_PATH)
+# None for models trained with VARIABLE_LENGTH: segments go in at their own length
+SEQUENCE_LENGTH = model.input_shape[1]
 
 with open(LABEL_MAP_PATH) as f:
     label_map = {int(k): v for k, v in json.load(f).items()}
@@ -32,10 +34,15 @@ hands = mp_hands.Hands(
 
 cap = cv2.VideoCapture(0)
 
-sequence = []
-prediction_queue = deque(maxlen=SMOOTHING_WINDOW)
 last_word = ""
 
+spotter = SignSpotter(
+    lambda x: model.predict(x, verbose=0)[0],
+    label_map,
+    sequence_length=SEQUENCE_LENGTH,
+    confidence_threshold=CONFIDENCE_THRESHOLD
+)
+
 def get_landmarks(results):
     if not results.multi_hand_landmarks:
         return None
@@ -70,30 +77,16 @@ while True:
     landmarks = get_landmarks(results)
 
     if landmarks is not None:
-        if len(sequence) < SEQUENCE_LENGTH:
-            sequence.append(landmarks)
-
         for h_lms in results.multi_hand_landmarks:
             mp_draw.draw_landmarks(frame, h_lms, mp_hands.HAND_CONNECTIONS)
-
     else:
-        if len(sequence) == SEQUENCE_LENGTH:
-            x = np.array(sequence, dtype=np.float32).reshape(1, SEQUENCE_LENGTH, FEATURES)
-            probs = model.predict(x, verbose=0)[0]
-
-            idx = np.argmax(probs)
-            conf = probs[idx]
-
-            if conf >= CONFIDENCE_THRESHOLD:
-                prediction_queue.append(idx)
-
-                if prediction_queue.count(idx) > SMOOTHING_WINDOW // 2:
-                    word = label_map[idx]
-                    if word != last_word:
-                        last_word = word
-                        print(f"🟢 Predicted: {word} ({conf:.2f})")
+        landmarks = [0.0] * FEATURES
 
-        sequence = []
+    # Words are emitted at motion boundaries, no need to drop the hands
+    word, conf = spotter.push(landmarks)
+    if word is not None:
+        last_word = word
+        print(f"🟢 Predicted: {word} ({conf:.2f})")
 
     cv2.putText(frame, f"Last: {last_word}", (10, 40),
                 cv2.FONT_HERSHEY_SIMPLEX, 1, (0,255,0), 2)
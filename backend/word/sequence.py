@@ -0,0 +1,72 @@
+import numpy as np
+
+# ================= CONFIG =================
+# Shared preprocessing for every word sequence, whatever recorded it:
+# capture.py (20×126), collect_word_data.py (variable × 63, one hand),
+# live frames on the server. Everything comes out as frames × 126.
+FEATURES = 126
+HAND_FEATURES = 63
+SEQUENCE_LENGTH = 20      # fixed-length models (word_model.h5)
+MAX_LENGTH = 60           # variable-length models: longer gestures are resampled down
+MAX_GESTURE = 240         # live buffers keep the whole gesture up to this (~8 s); prepare() resamples it
+MIN_FRAMES = 8            # shorter than this is a twitch, not a sign
+MIN_VISIBLE = 20
+# ==========================================
+
+
+def to_two_hands(sequence):
+    # Single-hand recordings go in the first hand slot, second stays empty
+    sequence = np.asarray(sequence, dtype=np.float32)
+    if sequence.ndim != 2:
+        raise ValueError(f"Expected frames × features, got shape {sequence.shape}")
+    features = sequence.shape[1]
+    if features == FEATURES:
+        return sequence
+    if features == HAND_FEATURES:
+        padded = np.zeros((sequence.shape[0], FEATURES), dtype=np.float32)
+        padded[:, :HAND_FEATURES] = sequence
+        return padded
+    raise ValueError(f"Unsupported feature count {features}")
+
+
+def trim(sequence, min_visible=MIN_VISIBLE):
+    # Drop frames before the hands appear and after they leave
+    visible = np.count_nonzero(sequence, axis=1) >= min_visible
+    idx = np.flatnonzero(visible)
+    if len(idx) == 0:
+        return sequence[:0]
+    return sequence[idx[0]:idx[-1] + 1]
+
+
+def resample(sequence, length=SEQUENCE_LENGTH):
+    # Linear interpolation along time, all frames and features at once
+    sequence = np.asarray(sequence, dtype=np.float32)
+    n = sequence.shape[0]
+    if n == length:
+        return sequence
+
+    pos = np.linspace(0, n - 1, length, dtype=np.float32)
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, n - 1)
+    w = (pos - lo)[:, None]
+    return sequence[lo] * (1.0 - w) + sequence[hi] * w
+
+
+def prepare(sequence, length=SEQUENCE_LENGTH, min_frames=MIN_FRAMES):
+    # length=None keeps the natural duration (capped at MAX_LENGTH)
+    # for models that take variable-length input
+    sequence = trim(to_two_hands(sequence))
+    if len(sequence) == 0 or len(sequence) < min_frames:
+        return None
+    if length is None:
+        return resample(sequence, MAX_LENGTH) if len(sequence) > MAX_LENGTH else sequence
+    return resample(sequence, length)
+
+
+def pad_batch(sequences):
+    # Zero frames are what the Masking layer skips
+    longest = max(len(s) for s in sequences)
+    batch = np.zeros((len(sequences), longest, FEATURES), dtype=np.float32)
+    for i, s in enumerate(sequences):
+        batch[i, :len(s)] = s
+    return batch
@@ -0,0 +1,124 @@
+import numpy as np
+from word.sequence import prepare
+
+# ================= CONFIG =================
+SEQUENCE_LENGTH = 20
+FEATURES = 126
+
+RING_SIZE = 90            # ~3 s at 30 fps
+PRE_ROLL = 3              # frames kept from before motion onset
+MIN_SIGN_FRAMES = 8
+MAX_SIGN_FRAMES = 60      # forces a boundary -> bounded latency
+
+START_ENERGY = 0.010      # mean |velocity| per coordinate to open a sign
+STOP_ENERGY = 0.004       # ... and to close it again
+PAUSE_FRAMES = 4          # low-energy frames that mark a boundary
+ENERGY_ALPHA = 0.5        # EMA smoothing of the energy signal
+
+CONFIDENCE_THRESHOLD = 0.85
+MIN_VISIBLE = 20          # same gate as word_inference.py
+# =========================================
+
+
+def motion_energy(prev, curr):
+    # Only compare coordinates visible in both frames so a hand
+    # appearing/disappearing doesn't register as a huge jump.
+    visible = (prev != 0) & (curr != 0)
+    count = np.count_nonzero(visible)
+    if count == 0:
+        return 0.0
+    return float(np.abs(curr - prev)[visible].sum() / count)
+
+
+class SignSpotter:
+    def __init__(self, classify, label_map, sequence_length=SEQUENCE_LENGTH,
+                 confidence_threshold=CONFIDENCE_THRESHOLD,
+                 start_energy=START_ENERGY, stop_energy=STOP_ENERGY,
+                 pause_frames=PAUSE_FRAMES, min_frames=MIN_SIGN_FRAMES,
+                 max_frames=MAX_SIGN_FRAMES):
+        self.classify = classify
+        self.label_map = label_map
+        self.sequence_length = sequence_length
+        self.confidence_threshold = confidence_threshold
+        self.start_energy = start_energy
+        self.stop_energy = stop_energy
+        self.pause_frames = pause_frames
+        self.min_frames = min_frames
+        self.max_frames = min(max_frames, RING_SIZE - PRE_ROLL)
+
+        self.ring = np.zeros((RING_SIZE, FEATURES), dtype=np.float32)
+        self.reset()
+
+    def reset(self):
+        self.head = 0           # next write slot
+        self.filled = 0
+        self.prev = None
+        self.energy = 0.0
+        self.active = False
+        self.sign_start = 0     # absolute frame index
+        self.frame_index = 0
+        self.quiet = 0
+
+    def _segment(self, start, end):
+        idx = np.arange(start, end) % RING_SIZE
+        return self.ring[idx]
+
+    def _close(self, end):
+        self.active = False
+        self.quiet = 0
+        length = end - self.sign_start
+        if length < self.min_frames:
+            return None, 0.0
+
+        # sequence_length=None: the model takes the segment at its own length
+        x = prepare(self._segment(self.sign_start, end), self.sequence_length)
+        if x is None:
+            return None, 0.0
+        probs = self.classify(x[None, ...])
+        idx = int(np.argmax(probs))
+        confidence = float(probs[idx])
+
+        if confidence < self.confidence_threshold:
+            return None, confidence
+        return self.label_map[idx], confidence
+
+    def push(self, landmarks):
+        frame = np.asarray(landmarks, dtype=np.float32).reshape(-1)[:FEATURES]
+        visible = np.count_nonzero(frame) >= MIN_VISIBLE
+
+        self.ring[self.head] = frame
+        self.head = (self.head + 1) % RING_SIZE
+        self.filled = min(self.filled + 1, RING_SIZE)
+        self.frame_index += 1
+
+        raw = motion_energy(self.prev, frame) if (self.prev is not None and visible) else 0.0
+        self.energy = ENERGY_ALPHA * raw + (1.0 - ENERGY_ALPHA) * self.energy
+        self.prev = frame if visible else None
+
+        if not self.active:
+            if visible and self.energy >= self.start_energy:
+                self.active = True
+                self.quiet = 0
+                pre_roll = min(PRE_ROLL, self.filled - 1)
+                self.sign_start = self.frame_index - 1 - pre_roll
+            return None, 0.0
+
+        # Hands dropped: the gesture is certainly over
+        if not visible:
+            return self._close(self.frame_index - 1)
+
+        if self.energy < self.stop_energy:
+            self.quiet += 1
+            if self.quiet >= self.pause_frames:
+                return self._close(self.frame_index - self.quiet)
+        else:
+            self.quiet = 0
+
+        if self.frame_index - self.sign_start >= self.max_frames:
+            result = self._close(self.frame_index)
+            # Keep spotting: the signer is still moving
+            self.active = True
+            self.sign_start = self.frame_index
+            return result
+
+        return None, 0.0
@@ -1,17 +1,27 @@
 import os
+import sys
 import numpy as np
 import json
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder
 from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense, Dropout
+from tensorflow.keras.layers import LSTM, Dense, Dropout, Masking
 from tensorflow.keras.utils import to_categorical
 from sklearn.metrics import classification_report, confusion_matrix
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from profiling import profiled
+from src.benchmark.holdout import is_holdout_file
+from word.sequence import FEATURES, SEQUENCE_LENGTH, prepare, pad_batch
+
 # ================= CONFIG =================
 DATA_DIR = "data/word_sequences"
-SEQUENCE_LENGTH = 20
-FEATURES = 126
+
+# False: every recording is resampled to SEQUENCE_LENGTH frames (what the
+# server's word_model.h5 expects). True: recordings keep their own length,
+# padded per batch and masked, so the server can classify a gesture the
+# moment it ends.
+VARIABLE_LENGTH = False
 
 MODEL_PATH = "models/word_model.h5"
 LABEL_MAP_PATH = "models/word_label_map.json"
@@ -32,20 +42,26 @@ for word in os.listdir(DATA_DIR):
 
     for file in os.listdir(word_path):
         if file.endswith(".npy"):
+            # Fixed evaluation split lives in src/benchmark/holdout.py
+            if is_holdout_file(os.path.join(word_path, file)):
+                continue
+
             seq = np.load(os.path.join(word_path, file))
 
-            if seq.shape != (SEQUENCE_LENGTH, FEATURES):
+            # Any length, one or two hands (capture.py / collect_word_data.py)
+            seq = prepare(seq, None if VARIABLE_LENGTH else SEQUENCE_LENGTH)
+            if seq is None:
                 continue
 
             X.append(seq)
             y.append(word)
 
-X = np.array(X)
-y = np.array(y)
-
 if len(X) == 0:
     raise ValueError("No data found!")
 
+X = pad_batch(X) if VARIABLE_LENGTH else np.array(X)
+y = np.array(y)
+
 print("Loaded:", X.shape)
 
 le = LabelEncoder()
@@ -65,8 +81,13 @@ X_train, X_test, y_train, y_test = train_test_split(
 )
 
 # ================= MODEL =================
-model = Sequential([
-    LSTM(128, return_sequences=True, input_shape=(SEQUENCE_LENGTH, FEATURES)),
+if VARIABLE_LENGTH:
+    # Padding frames are all-zero; Masking makes both LSTMs skip them
+    input_layers = [Masking(mask_value=0.0, input_shape=(None, FEATURES)), LSTM(128, return_sequences=True)]
+else:
+    input_layers = [LSTM(128, return_sequences=True, input_shape=(SEQUENCE_LENGTH, FEATURES))]
+
+model = Sequential(input_layers + [
     Dropout(0.4),
     LSTM(64),
     Dropout(0.4),
@@ -81,12 +102,14 @@ model.compile(
     metrics=["accuracy"]
 )
 
-model.fit(
-    X_train, y_train,
-    validation_data=(X_test, y_test),
-    epochs=EPOCHS,
-    batch_size=BATCH_SIZE
-)
+# ISL_PROFILE_RATE=1 dumps a profile of the training run
+with profiled("train_word"):
+    model.fit(
+        X_train, y_train,
+        validation_data=(X_test, y_test),
+        epochs=EPOCHS,
+        batch_size=BATCH_SIZE
+    )
 
 model.save(MODEL_PATH)
 
@@ -1,62 +1,171 @@
-import json
+import os
 import numpy as np
 from collections import deque
-from tensorflow.keras.models import load_model
+from word.spotter import SignSpotter
+from word.sequence import MAX_GESTURE, MIN_VISIBLE, prepare
+import metrics
+import gating
+from model_registry import registry, select_backend
+from session_state import SessionState, SessionStore
 
 # ================= CONFIG =================
 MODEL_PATH = "word/models/word_model.h5"
 LABEL_MAP_PATH = "word/models/word_label_map.json"
-
-SEQUENCE_LENGTH = 20
+MODEL_VERSION = "v1"
+
+# ISL_MODEL_BACKEND=mmap serves the shared_weights.py export instead;
+# ISL_WORD_BACKEND overrides it for the word model alone (e.g. torch)
+MODEL_BACKEND, MODEL_PATH, LABEL_MAP_PATH = select_backend(
+    "word", MODEL_PATH, LABEL_MAP_PATH, env=("ISL_WORD_BACKEND", "ISL_MODEL_BACKEND"))
+if MODEL_BACKEND == "torch":
+    print("⚠️ word_lstm_model.pth scores at chance on the recorded words; benchmarking only")
+
+# ISL_WORD_VARIABLE_LENGTH=1 for a model trained with VARIABLE_LENGTH
+# (word/train.py): gestures go in at their own length, masked. This only
+# sets the startup model's spec; requests follow the serving bundle's.
+SEQUENCE_LENGTH = None if os.environ.get("ISL_WORD_VARIABLE_LENGTH") == "1" else 20
 FEATURES = 126
 
-CONFIDENCE_THRESHOLD = 0.85
-SMOOTHING_WINDOW = 3
+CONFIDENCE_THRESHOLD = gating.WORD_CONFIDENCE
+SMOOTHING_WINDOW = gating.WORD_SMOOTHING
+FEATURE_SPEC = {"input_shape": [SEQUENCE_LENGTH, FEATURES], "backend": MODEL_BACKEND}
 # =========================================
 
-model = load_model(MODEL_PATH)
-
-with open(LABEL_MAP_PATH) as f:
-    label_map = {int(k): v for k, v in json.load(f).items()}
-
-sequence_buffer = []
-prediction_queue = deque(maxlen=SMOOTHING_WINDOW)
-last_word = ""
-
-def predict_word(landmarks):
-    global sequence_buffer, last_word
-
+registry.ensure("word", MODEL_VERSION, MODEL_PATH, LABEL_MAP_PATH, FEATURE_SPEC)
+
+def _classify(x):
+    with metrics.stage("word_stream", "predict"):
+        return registry.get("word").predict(x)[0]
+
+def sequence_length(bundle):
+    # Window the bundle was loaded for (input_shape[0]); None = variable length.
+    # Read per request so /admin/models/word/load can swap in another shape.
+    return bundle.spec["input_shape"][0]
+
+class WordSession(SessionState):
+    # Gesture buffer, smoothing and spotter for one client
+    def __init__(self):
+        super().__init__()
+        self.buffer = []
+        self.consumed = False   # the sliding window already named this gesture
+        self.queue = deque(maxlen=SMOOTHING_WINDOW)
+        self.last_word = ""
+        bundle = registry.get("word")
+        self.spotter = SignSpotter(_classify, bundle.label_map,
+                                   sequence_length=sequence_length(bundle),
+                                   confidence_threshold=CONFIDENCE_THRESHOLD)
+
+sessions = SessionStore(WordSession)
+
+def predict_word(landmarks, session=None):
+    state = sessions.get(session)
+    with state.lock:
+        return _predict_word(state, landmarks)
+
+def _predict_word(state, landmarks):
     # Skip empty frames
-    if np.count_nonzero(landmarks) < 20:
-        
+    with metrics.stage("word", "gate"):
+        visible = np.count_nonzero(landmarks)
+    if visible < MIN_VISIBLE:
+        # Hands dropped: the gesture is complete, classify it now
+        return _finish_gesture(state)
+
+    _append(state, landmarks)
+
+    # Variable-length models only ever see whole gestures
+    bundle = registry.get("word")
+    length = sequence_length(bundle)
+    if length is None or len(state.buffer) < length:
         return None, 0.0
 
-    sequence_buffer.append(landmarks)
+    # Sliding window over the last `length` frames
+    x = np.array(state.buffer[-length:], dtype=np.float32)
+    x = x.reshape(1, length, FEATURES)
 
-    if len(sequence_buffer) < SEQUENCE_LENGTH:
-        return None, 0.0
-
-    # Keep only last 15 frames
-    sequence_buffer = sequence_buffer[-SEQUENCE_LENGTH:]
-
-    x = np.array(sequence_buffer, dtype=np.float32)
-    x = x.reshape(1, SEQUENCE_LENGTH, FEATURES)
-
-    probs = model.predict(x, verbose=0)[0]
+    with metrics.stage("word", "predict"):
+        probs = bundle.predict(x)[0]
+    registry.shadow_score("word", x, probs)
     idx = int(np.argmax(probs))
     confidence = float(probs[idx])
 
     if confidence < CONFIDENCE_THRESHOLD:
         return None, confidence
 
-    prediction_queue.append(idx)
+    state.queue.append(idx)
 
-    if prediction_queue.count(idx) > SMOOTHING_WINDOW // 2:
-        word = label_map[idx]
+    if state.queue.count(idx) > SMOOTHING_WINDOW // 2:
+        word = bundle.label_map[idx]
 
-        if word != last_word:
-            last_word = word
-            sequence_buffer = []   # Reset after prediction
+        if word != state.last_word:
+            state.last_word = word
+            state.buffer = []   # Reset after prediction
+            state.consumed = True
             return word, confidence
 
     return None, confidence
+
+def _append(state, landmarks):
+    # The whole gesture, not just the last window: the start of a long
+    # sign matters when it is classified at the end
+    state.buffer.append(landmarks)
+    if len(state.buffer) > MAX_GESTURE:
+        del state.buffer[0]
+
+def _finish_gesture(state):
+    # Whole gesture, resampled (or as-is for variable-length models),
+    # instead of waiting for a full window that may never come
+    frames, state.buffer = state.buffer, []
+    if state.consumed:
+        # Leftover frames of a gesture the window already emitted
+        state.consumed = False
+        return None, 0.0
+    bundle = registry.get("word")
+    x = prepare(frames, sequence_length(bundle)) if frames else None
+    if x is None:
+        return None, 0.0
+
+    x = x[None, ...]
+    with metrics.stage("word", "predict"):
+        probs = bundle.predict(x)[0]
+    registry.shadow_score("word", x, probs)
+    idx = int(np.argmax(probs))
+    confidence = float(probs[idx])
+
+    if confidence < CONFIDENCE_THRESHOLD:
+        return None, confidence
+
+    word = bundle.label_map[idx]
+    if word == state.last_word:
+        return None, confidence
+    state.last_word = word
+    state.queue.clear()
+    return word, confidence
+
+def predict_word_frames(frames, session=None):
+    # Frames that queued up behind a slow request: buffer all of them,
+    # but only run the model once, on the newest (or when a gesture ended).
+    state = sessions.get(session)
+    with state.lock:
+        ended = (None, 0.0)
+        for landmarks in frames[:-1]:
+            if np.count_nonzero(landmarks) >= MIN_VISIBLE:
+                _append(state, landmarks)
+            elif state.buffer or state.consumed:
+                result = _finish_gesture(state)
+                if result[0] is not None:
+                    ended = result
+
+        result = _predict_word(state, frames[-1])
+    return result if result[0] is not None or ended[0] is None else ended
+
+
+# ================= CONTINUOUS SPOTTING =================
+# Classifies at motion boundaries instead of waiting for the hands to drop,
+# so consecutive words in a sentence are emitted as they are signed.
+def predict_word_stream(landmarks, session=None):
+    state = sessions.get(session)
+    with state.lock:
+        bundle = registry.get("word")
+        state.spotter.label_map = bundle.label_map
+        state.spotter.sequence_length = sequence_length(bundle)
+        return state.spotter.push(landmarks)
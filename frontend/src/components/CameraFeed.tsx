@@ -21,6 +21,7 @@ const CameraFeed = ({ isActive, onToggle, onLandmarks }: CameraFeedProps) => {
   const videoRef = useRef<HTMLVideoElement>(null);
   const canvasRef = useRef<HTMLCanvasElement>(null);
   const cameraRef = useRef<MpCamera | null>(null);
+  const handsVisibleRef = useRef(false);
 
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -84,6 +85,12 @@ const CameraFeed = ({ isActive, onToggle, onLandmarks }: CameraFeedProps) => {
       console.log("📤 Sending landmarks:", flatLandmarks.slice(0, 10));
 
       onLandmarks(flatLandmarks);
+      handsVisibleRef.current = true;
+    } else if (handsVisibleRef.current) {
+      // One empty frame when the hands leave, so word predictors
+      // (server and on-device) know the gesture has ended
+      onLandmarks(new Array(126).fill(0));
+      handsVisibleRef.current = false;
     }
   }, [flattenLandmarks, onLandmarks]);
 
@@ -0,0 +1,83 @@
+import { useEffect, useState } from 'react';
+import { motion } from 'framer-motion';
+import { Cloud, Cpu } from 'lucide-react';
+import { getInferenceMode, setInferenceMode, InferenceMode } from '@/lib/mlApi';
+
+const InferenceToggle = () => {
+  const [mode, setMode] = useState<InferenceMode>(getInferenceMode());
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState<string | null>(null);
+
+  const choose = async (next: InferenceMode) => {
+    setLoading(true);
+    setError(null);
+    try {
+      await setInferenceMode(next);
+      setMode(next);
+    } catch (err) {
+      console.error("Local inference unavailable:", err);
+      await setInferenceMode('server');
+      setMode('server');
+      setError('Local models not available, using server');
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  // A saved "local" choice still needs its models fetched on page load
+  useEffect(() => {
+    if (getInferenceMode() === 'local') choose('local');
+  }, []);
+
+  return (
+    <div className="flex items-center gap-3">
+      <div className="glass-panel p-1 inline-flex items-center gap-1">
+        <button
+          onClick={() => choose('server')}
+          disabled={loading}
+          className={`relative flex items-center gap-2 px-4 py-2.5 rounded-lg font-medium text-sm transition-colors ${
+            mode === 'server'
+              ? 'text-primary-foreground'
+              : 'text-muted-foreground hover:text-foreground'
+          }`}
+        >
+          {mode === 'server' && (
+            <motion.div
+              layoutId="inferenceMode"
+              className="absolute inset-0 bg-primary rounded-lg"
+              transition={{ type: 'spring', bounce: 0.2, duration: 0.4 }}
+            />
+          )}
+          <Cloud className="w-4 h-4 relative z-10" />
+          <span className="relative z-10">Server</span>
+        </button>
+
+        <div className="w-px h-6 bg-border" />
+
+        <button
+          onClick={() => choose('local')}
+          disabled={loading}
+          className={`relative flex items-center gap-2 px-4 py-2.5 rounded-lg font-medium text-sm transition-colors ${
+            mode === 'local'
+              ? 'text-accent-foreground'
+              : 'text-muted-foreground hover:text-foreground'
+          }`}
+        >
+          {mode === 'local' && (
+            <motion.div
+              layoutId="inferenceMode"
+              className="absolute inset-0 bg-accent rounded-lg"
+              transition={{ type: 'spring', bounce: 0.2, duration: 0.4 }}
+            />
+          )}
+          <Cpu className="w-4 h-4 relative z-10" />
+          <span className="relative z-10">{loading ? 'Loading...' : 'On device'}</span>
+        </button>
+      </div>
+
+      {error && <span className="text-xs text-muted-foreground">{error}</span>}
+    </div>
+  );
+};
+
+export default InferenceToggle;
@@ -0,0 +1,59 @@
+import { motion } from 'framer-motion';
+import { Type, Layers } from 'lucide-react';
+
+// "words" uses /predict-word; "fused" uses /predict-fused, which also
+// picks up fingerspelled letters from the same camera stream (server only)
+export type Recognition = 'words' | 'fused';
+
+interface RecognitionToggleProps {
+  recognition: Recognition;
+  onRecognitionChange: (recognition: Recognition) => void;
+}
+
+const RecognitionToggle = ({ recognition, onRecognitionChange }: RecognitionToggleProps) => {
+  return (
+    <div className="glass-panel p-1 inline-flex items-center gap-1">
+      <button
+        onClick={() => onRecognitionChange('words')}
+        className={`relative flex items-center gap-2 px-4 py-2.5 rounded-lg font-medium text-sm transition-colors ${
+          recognition === 'words'
+            ? 'text-primary-foreground'
+            : 'text-muted-foreground hover:text-foreground'
+        }`}
+      >
+        {recognition === 'words' && (
+          <motion.div
+            layoutId="recognition"
+            className="absolute inset-0 bg-primary rounded-lg"
+            transition={{ type: 'spring', bounce: 0.2, duration: 0.4 }}
+          />
+        )}
+        <Type className="w-4 h-4 relative z-10" />
+        <span className="relative z-10">Words</span>
+      </button>
+
+      <div className="w-px h-6 bg-border" />
+
+      <button
+        onClick={() => onRecognitionChange('fused')}
+        className={`relative flex items-center gap-2 px-4 py-2.5 rounded-lg font-medium text-sm transition-colors ${
+          recognition === 'fused'
+            ? 'text-accent-foreground'
+            : 'text-muted-foreground hover:text-foreground'
+        }`}
+      >
+        {recognition === 'fused' && (
+          <motion.div
+            layoutId="recognition"
+            className="absolute inset-0 bg-accent rounded-lg"
+            transition={{ type: 'spring', bounce: 0.2, duration: 0.4 }}
+          />
+        )}
+        <Layers className="w-4 h-4 relative z-10" />
+        <span className="relative z-10">Letters + words</span>
+      </button>
+    </div>
+  );
+};
+
+export default RecognitionToggle;
@@ -4,6 +4,23 @@ import { MessageSquare, Send, Mic, MicOff, Hand, Loader2 } from 'lucide-react';
 import { Button } from '@/components/ui/button';
 import { Textarea } from '@/components/ui/textarea';
 
+interface SignFrame {
+  label: string;
+  x: number;
+  y: number;
+}
+
+// Playback plan from POST /sign-plan: every sign is a cell of one atlas image
+interface SignPlan {
+  text: string;
+  translated_text: string;
+  atlas: { url: string; cell: number; width: number; height: number };
+  words: { word: string; kind: 'word' | 'letters'; signs: SignFrame[] }[];
+}
+
+const API_URL = "http://localhost:8000";
+const SIGN_SIZE = 64;
+
 interface TextToSignProps {
   onTranslate: (text: string) => void;
   isTranslating: boolean;
@@ -35,6 +52,7 @@ const TextToSign = ({
   const [targetLang, setTargetLang] = useState("hi");
   const [translatedText, setTranslatedText] = useState("");
   const [isSpeaking, setIsSpeaking] = useState(false);
+  const [plan, setPlan] = useState<SignPlan | null>(null);
 
   const getISLImage = (char: string) => {
     const upper = char.toUpperCase();
@@ -48,49 +66,53 @@ const TextToSign = ({
     if (!inputText.trim()) return;
 
     try {
-      let targetTranslation = inputText.trim();
-      let englishTranslation = inputText.trim();
-
-      // 🔹 1. Source → Target (Google style)
-      if (sourceLang !== targetLang) {
-        const res1 = await fetch("http://localhost:8000/translate", {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({
-            text: inputText.trim(),
-            source: sourceLang,
-            target: targetLang
-          })
-        });
-
-        const data1 = await res1.json();
-        targetTranslation = data1.translated_text;
-      }
-
-      // 🔹 2. Source → English (for Sign)
-      if (sourceLang !== "en") {
-        const res2 = await fetch("http://localhost:8000/translate", {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({
-            text: inputText.trim(),
-            source: sourceLang,
-            target: "en"
-          })
-        });
-
-        const data2 = await res2.json();
-        englishTranslation = data2.translated_text;
-      }
-
-      setTranslatedText(targetTranslation);
-      onTranslate(englishTranslation);
+      // 🔹 Translations + sign plan in a single round trip
+      const res = await fetch(`${API_URL}/sign-plan`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
+          text: inputText.trim(),
+          source: sourceLang,
+          target: targetLang
+        })
+      });
+
+      if (!res.ok) throw new Error(`sign-plan failed: ${res.status}`);
+      const data: SignPlan = await res.json();
+
+      setPlan(data);
+      setTranslatedText(data.translated_text);
+      onTranslate(data.text);
 
     } catch (error) {
       console.error("Translation error:", error);
+      // Fall back to per-letter images for whatever was typed
+      setPlan(null);
+      onTranslate(inputText.trim());
     }
   };
 
+  const renderSign = (sign: SignFrame, key: string) => {
+    const scale = SIGN_SIZE / plan!.atlas.cell;
+    return (
+      <div key={key} className="flex flex-col items-center">
+        <div
+          role="img"
+          aria-label={sign.label}
+          className="mb-1 rounded-md"
+          style={{
+            width: SIGN_SIZE,
+            height: SIGN_SIZE,
+            backgroundImage: `url(${API_URL}${plan!.atlas.url})`,
+            backgroundSize: `${plan!.atlas.width * scale}px ${plan!.atlas.height * scale}px`,
+            backgroundPosition: `-${sign.x * scale}px -${sign.y * scale}px`
+          }}
+        />
+        <span className="text-xs uppercase">{sign.label}</span>
+      </div>
+    );
+  };
+
   const toggleSpeechRecognition = () => {
     if (!isListening) {
       if ('webkitSpeechRecognition' in window || 'SpeechRecognition' in window) {
@@ -243,7 +265,15 @@ const TextToSign = ({
         </p>
 
         <div className="h-full min-h-[150px] rounded-xl bg-secondary/50 p-4 flex items-center justify-center">
-          {currentSignDisplay ? (
+          {currentSignDisplay && plan && plan.text === currentSignDisplay ? (
+            <div className="flex flex-wrap justify-center gap-6">
+              {plan.words.map((word, w) => (
+                <div key={w} className="flex flex-wrap justify-center gap-3">
+                  {word.signs.map((sign, i) => renderSign(sign, `${w}-${i}`))}
+                </div>
+              ))}
+            </div>
+          ) : currentSignDisplay ? (
             <div className="flex flex-wrap justify-center gap-3">
               {currentSignDisplay.split('').map((char, index) =>
                 char === ' ' ? (
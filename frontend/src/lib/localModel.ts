@@ -0,0 +1,323 @@
+// In-browser copy of the backend models, exported by backend/browser_export.py.
+// The forward pass mirrors backend/shared_weights.py (Dense + LSTM, dropout
+// removed), and the predictors mirror the gating/smoothing in inference.py
+// and word/word_inference.py, so local and server results match.
+
+interface Tensor {
+  offset: number;
+  shape: number[];
+}
+
+interface LayerSpec {
+  type: "dense" | "lstm" | "masking";
+  activation?: string;
+  mask_value?: number;
+  recurrent_activation?: string;
+  return_sequences?: boolean;
+  weights: Tensor[];
+}
+
+interface Gating {
+  min_visible: number;
+  confidence_threshold: number;
+  smoothing_window: number;
+  sequence_length?: number | null;
+  min_frames?: number;
+  max_length?: number;
+  max_gesture?: number;
+}
+
+interface Manifest {
+  name: string;
+  layers: LayerSpec[];
+  labels: string[];
+  gating: Gating;
+}
+
+export interface LocalResult {
+  label: string | null;
+  confidence: number;
+}
+
+const activations: Record<string, (z: number) => number> = {
+  relu: (z) => (z > 0 ? z : 0),
+  sigmoid: (z) => 1 / (1 + Math.exp(-z)),
+  hard_sigmoid: (z) => Math.min(1, Math.max(0, 0.2 * z + 0.5)),
+  tanh: Math.tanh,
+  linear: (z) => z,
+};
+
+function activation(name: string) {
+  const fn = activations[name];
+  if (!fn) throw new Error(`Unsupported activation: ${name}`);
+  return fn;
+}
+
+function softmax(z: Float32Array) {
+  let max = -Infinity;
+  for (const v of z) max = Math.max(max, v);
+  let sum = 0;
+  for (let i = 0; i < z.length; i++) {
+    z[i] = Math.exp(z[i] - max);
+    sum += z[i];
+  }
+  for (let i = 0; i < z.length; i++) z[i] /= sum;
+  return z;
+}
+
+// out = x @ kernel + bias, kernel stored row-major as [inputs, units]
+function affine(x: Float32Array, kernel: Float32Array, bias: Float32Array | null, units: number, out?: Float32Array) {
+  const y = out ?? new Float32Array(units);
+  if (bias) y.set(bias);
+  for (let i = 0; i < x.length; i++) {
+    const xi = x[i];
+    if (xi === 0) continue;
+    const row = i * units;
+    for (let j = 0; j < units; j++) y[j] += xi * kernel[row + j];
+  }
+  return y;
+}
+
+class Layer {
+  constructor(readonly spec: LayerSpec, readonly weights: Float32Array[]) {}
+
+  dense(x: Float32Array) {
+    const [kernel, bias] = this.weights;
+    const y = affine(x, kernel, bias, bias.length);
+    if (this.spec.activation === "softmax") return softmax(y);
+    const act = activation(this.spec.activation);
+    for (let j = 0; j < y.length; j++) y[j] = act(y[j]);
+    return y;
+  }
+
+  // Gate order i, f, c, o — same as Keras and shared_weights._lstm.
+  // Masked steps (after a Masking layer) carry the previous state through.
+  lstm(steps: Float32Array[], mask: boolean[] | null) {
+    const [kernel, recurrent, bias] = this.weights;
+    const units = bias.length / 4;
+    const act = activation(this.spec.activation);
+    const recAct = activation(this.spec.recurrent_activation ?? "sigmoid");
+
+    let h = new Float32Array(units);
+    const c = new Float32Array(units);
+    const z = new Float32Array(4 * units);
+    const outputs: Float32Array[] = [];
+
+    for (let t = 0; t < steps.length; t++) {
+      if (mask && !mask[t]) {
+        if (this.spec.return_sequences) outputs.push(h);
+        continue;
+      }
+      affine(steps[t], kernel, bias, 4 * units, z);
+      for (let i = 0; i < units; i++) {
+        const hi = h[i];
+        if (hi === 0) continue;
+        const row = i * 4 * units;
+        for (let j = 0; j < 4 * units; j++) z[j] += hi * recurrent[row + j];
+      }
+
+      const next = new Float32Array(units);
+      for (let j = 0; j < units; j++) {
+        const ig = recAct(z[j]);
+        const fg = recAct(z[units + j]);
+        const g = act(z[2 * units + j]);
+        const og = recAct(z[3 * units + j]);
+        c[j] = fg * c[j] + ig * g;
+        next[j] = og * act(c[j]);
+      }
+      h = next;
+      if (this.spec.return_sequences) outputs.push(h);
+    }
+
+    return this.spec.return_sequences ? outputs : [h];
+  }
+}
+
+export class LocalModel {
+  private constructor(readonly manifest: Manifest, private layers: Layer[]) {}
+
+  static async load(name: string) {
+    const base = `/models/${name}`;
+    const [manifestRes, weightsRes] = await Promise.all([
+      fetch(`${base}/model.json`),
+      fetch(`${base}/weights.bin`),
+    ]);
+    if (!manifestRes.ok || !weightsRes.ok) {
+      throw new Error(`Local ${name} model not exported (run python -m browser_export)`);
+    }
+
+    const manifest: Manifest = await manifestRes.json();
+    const blob = new Float32Array(await weightsRes.arrayBuffer());
+    const layers = manifest.layers.map(
+      (spec) =>
+        new Layer(
+          spec,
+          spec.weights.map((t) => blob.subarray(t.offset, t.offset + t.shape.reduce((a, b) => a * b, 1)))
+        )
+    );
+    return new LocalModel(manifest, layers);
+  }
+
+  // Input is one frame (MLP) or a sequence of frames (LSTM); returns probabilities
+  predict(input: number[] | number[][]) {
+    let seq: Float32Array[] = Array.isArray(input[0])
+      ? (input as number[][]).map((f) => Float32Array.from(f))
+      : [Float32Array.from(input as number[])];
+
+    let mask: boolean[] | null = null;
+    for (const layer of this.layers) {
+      if (layer.spec.type === "masking") {
+        const value = layer.spec.mask_value ?? 0;
+        mask = seq.map((x) => x.some((v) => v !== value));
+      } else if (layer.spec.type === "lstm") {
+        seq = layer.lstm(seq, mask);
+        if (!layer.spec.return_sequences) mask = null;
+      } else {
+        seq = seq.map((x) => layer.dense(x));
+      }
+    }
+    return seq[seq.length - 1];
+  }
+}
+
+function argmax(probs: Float32Array) {
+  let idx = 0;
+  for (let i = 1; i < probs.length; i++) if (probs[i] > probs[idx]) idx = i;
+  return idx;
+}
+
+function countNonZero(landmarks: number[]) {
+  let n = 0;
+  for (const v of landmarks) if (v !== 0) n++;
+  return n;
+}
+
+// Majority vote over the last few confident predictions (prediction_queue)
+class Smoother {
+  private queue: number[] = [];
+  last = "";
+
+  constructor(private window: number) {}
+
+  vote(idx: number) {
+    this.queue.push(idx);
+    if (this.queue.length > this.window) this.queue.shift();
+    return this.queue.filter((v) => v === idx).length > Math.floor(this.window / 2);
+  }
+
+  clear() {
+    this.queue = [];
+  }
+}
+
+// Mirrors inference.predict_landmarks
+export class LocalAlphabetPredictor {
+  private smoother: Smoother;
+
+  constructor(private model: LocalModel) {
+    this.smoother = new Smoother(model.manifest.gating.smoothing_window);
+  }
+
+  predict(landmarks: number[]): LocalResult {
+    const { min_visible, confidence_threshold } = this.model.manifest.gating;
+    if (countNonZero(landmarks) < min_visible) return { label: null, confidence: 0 };
+
+    const probs = this.model.predict(landmarks);
+    const idx = argmax(probs);
+    const confidence = probs[idx];
+    if (confidence < confidence_threshold) return { label: null, confidence };
+
+    if (this.smoother.vote(idx)) {
+      const char = this.model.manifest.labels[idx];
+      if (char !== this.smoother.last) {
+        this.smoother.last = char;
+        return { label: char, confidence };
+      }
+    }
+    return { label: null, confidence };
+  }
+}
+
+// Linear interpolation along time, like word/sequence.resample
+function resample(frames: number[][], length: number) {
+  const n = frames.length;
+  if (n === length) return frames;
+  const out: number[][] = [];
+  for (let t = 0; t < length; t++) {
+    const pos = length === 1 ? 0 : (t * (n - 1)) / (length - 1);
+    const lo = Math.floor(pos);
+    const hi = Math.min(lo + 1, n - 1);
+    const w = pos - lo;
+    out.push(frames[lo].map((v, j) => v * (1 - w) + frames[hi][j] * w));
+  }
+  return out;
+}
+
+// Mirrors word_inference.predict_word / finish_gesture
+export class LocalWordPredictor {
+  private smoother: Smoother;
+  private buffer: number[][] = [];
+  // The sliding window already named this gesture; its leftovers are dropped
+  private consumed = false;
+
+  constructor(private model: LocalModel) {
+    this.smoother = new Smoother(model.manifest.gating.smoothing_window);
+  }
+
+  predict(landmarks: number[]): LocalResult {
+    const { min_visible, max_gesture = 240 } = this.model.manifest.gating;
+    const length = this.model.manifest.gating.sequence_length ?? null;
+
+    // Hands dropped: the gesture is complete, classify it now
+    if (countNonZero(landmarks) < min_visible) return this.finishGesture();
+
+    // Whole gesture, up to the hard cap; finishGesture resamples it
+    this.buffer.push(landmarks);
+    if (this.buffer.length > max_gesture) this.buffer.shift();
+
+    // Variable-length models only ever see whole gestures
+    if (length === null || this.buffer.length < length) return { label: null, confidence: 0 };
+
+    const probs = this.model.predict(this.buffer.slice(-length));
+    const idx = argmax(probs);
+    const confidence = probs[idx];
+    if (confidence < this.model.manifest.gating.confidence_threshold) return { label: null, confidence };
+
+    if (this.smoother.vote(idx)) {
+      const word = this.model.manifest.labels[idx];
+      if (word !== this.smoother.last) {
+        this.smoother.last = word;
+        this.buffer = [];
+        this.consumed = true;
+        return { label: word, confidence };
+      }
+    }
+    return { label: null, confidence };
+  }
+
+  private finishGesture(): LocalResult {
+    const { min_frames = 8, max_length = 60, confidence_threshold } = this.model.manifest.gating;
+    const length = this.model.manifest.gating.sequence_length ?? null;
+    const frames = this.buffer;
+    this.buffer = [];
+    if (this.consumed) {
+      this.consumed = false;
+      return { label: null, confidence: 0 };
+    }
+    if (frames.length < min_frames) return { label: null, confidence: 0 };
+
+    // Like word/sequence.prepare: variable-length models get at most max_length frames
+    const input = length !== null ? resample(frames, length)
+      : frames.length > max_length ? resample(frames, max_length) : frames;
+    const probs = this.model.predict(input);
+    const idx = argmax(probs);
+    const confidence = probs[idx];
+    if (confidence < confidence_threshold) return { label: null, confidence };
+
+    const word = this.model.manifest.labels[idx];
+    if (word === this.smoother.last) return { label: null, confidence };
+    this.smoother.last = word;
+    this.smoother.clear();
+    return { label: word, confidence };
+  }
+}
@@ -1,10 +1,55 @@
+import { LocalAlphabetPredictor, LocalModel, LocalWordPredictor } from "@/lib/localModel";
+
+// One id per tab so the backend can coalesce this tab's frames
+const SESSION_ID = Math.random().toString(36).slice(2);
+
+// ================= INFERENCE MODE =================
+// "local" runs the exported models in this tab; "server" posts every frame.
+export type InferenceMode = "server" | "local";
+
+const MODE_KEY = "inferenceMode";
+let mode: InferenceMode = localStorage.getItem(MODE_KEY) === "local" ? "local" : "server";
+
+let alphabetLocal: Promise<LocalAlphabetPredictor> | null = null;
+let wordLocal: Promise<LocalWordPredictor> | null = null;
+
+export function getInferenceMode() {
+  return mode;
+}
+
+// Loads the local models up front so the first frame doesn't wait on them.
+// Rejects (and stays on the server) if they haven't been exported.
+export async function setInferenceMode(next: InferenceMode) {
+  if (next === "local") {
+    alphabetLocal ??= LocalModel.load("alphabet").then((m) => new LocalAlphabetPredictor(m));
+    wordLocal ??= LocalModel.load("word").then((m) => new LocalWordPredictor(m));
+    try {
+      await Promise.all([alphabetLocal, wordLocal]);
+    } catch (err) {
+      alphabetLocal = wordLocal = null;
+      throw err;
+    }
+  }
+  mode = next;
+  localStorage.setItem(MODE_KEY, next);
+}
+
 export async function predictLandmarks(landmarks: number[]) {
+  if (mode === "local" && alphabetLocal) {
+    return (await alphabetLocal).predict(landmarks);
+  }
+
   const response = await fetch("http://127.0.0.1:8000/predict", {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
+    headers: { "Content-Type": "application/json", "X-Session-Id": SESSION_ID },
     body: JSON.stringify({ landmarks }),
   });
 
+  // Server is overloaded and shed this frame; treat it as "no prediction"
+  if (response.status === 503) {
+    return { label: null, confidence: 0 };
+  }
+
   if (!response.ok) {
     throw new Error("Prediction failed");
   }
@@ -14,15 +59,42 @@ export async function predictLandmarks(landmarks: number[]) {
 
 // 🔥 ADD THIS
 export async function predictWord(landmarks: number[]) {
+  if (mode === "local" && wordLocal) {
+    return (await wordLocal).predict(landmarks);
+  }
+
   const response = await fetch("http://127.0.0.1:8000/predict-word", {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
+    headers: { "Content-Type": "application/json", "X-Session-Id": SESSION_ID },
     body: JSON.stringify({ landmarks }),
   });
 
+  if (response.status === 503) {
+    return { label: null, confidence: 0 };
+  }
+
   if (!response.ok) {
     throw new Error("Word prediction failed");
   }
 
   return response.json(); // { label, confidence }
 }
+
+// Alphabet + word from one stream; the server picks letter or word
+export async function predictFused(landmarks: number[]) {
+  const response = await fetch("http://127.0.0.1:8000/predict-fused", {
+    method: "POST",
+    headers: { "Content-Type": "application/json", "X-Session-Id": SESSION_ID },
+    body: JSON.stringify({ landmarks }),
+  });
+
+  if (response.status === 503) {
+    return { label: null, confidence: 0, type: null };
+  }
+
+  if (!response.ok) {
+    throw new Error("Fused prediction failed");
+  }
+
+  return response.json(); // { label, confidence, type, letter, word }
+}
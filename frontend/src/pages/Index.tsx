@@ -10,6 +10,7 @@ import TextToSign from '@/components/TextToSign';
 import ModeToggle from '@/components/ModeToggle';
 import StatsCard from '@/components/StatsCard';
 import AlphabetWordToggle from '@/components/AlphabetWordToggle';
+import InferenceToggle from '@/components/InferenceToggle';
 import { predictLandmarks } from "@/lib/mlApi";
 
 interface HandLandmark {
@@ -79,6 +80,9 @@ const clearAll = useCallback(() => {
   return;
 }
 
+      // Hands-gone marker from CameraFeed; letters need a visible hand
+      if (flatLandmarks.every(v => v === 0)) return;
+
 // ✅ Track when hand is present
 lastHandDetectedRef.current = Date.now();
 
@@ -221,9 +225,10 @@ useEffect(() => {
           initial={{ opacity: 0, y: 20 }}
           animate={{ opacity: 1, y: 0 }}
           transition={{ delay: 0.05 }}
-          className="mt-4"
+          className="mt-4 flex flex-wrap items-center gap-4"
         >
           <AlphabetWordToggle />
+          <InferenceToggle />
         </motion.div>
 
         {/* MODE + STATS */}
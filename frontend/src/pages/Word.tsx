@@ -1,4 +1,4 @@
-import { useState, useCallback, useEffect } from 'react';
+import { useState, useCallback, useEffect, useRef } from 'react';
 import { motion } from 'framer-motion';
 import { Hand, Type, BarChart3 } from 'lucide-react';
 
@@ -10,7 +10,9 @@ import TextToSign from '@/components/TextToSign';
 import ModeToggle from '@/components/ModeToggle';
 import StatsCard from '@/components/StatsCard';
 import AlphabetWordToggle from '@/components/AlphabetWordToggle';
-import { predictWord } from "@/lib/mlApi";
+import InferenceToggle from '@/components/InferenceToggle';
+import RecognitionToggle, { Recognition } from '@/components/RecognitionToggle';
+import { predictFused, predictWord } from "@/lib/mlApi";
 
 interface Prediction {
   text: string;
@@ -35,6 +37,8 @@ const Word = () => {
   const [history, setHistory] = useState<HistoryEntry[]>([]);
   const [textToSignInput, setTextToSignInput] = useState<string | null>(null);
   const [isTranslating, setIsTranslating] = useState(false);
+  const [recognition, setRecognition] = useState<Recognition>('words');
+  const lastType = useRef<'letter' | 'word' | null>(null);
 
   const [stats, setStats] = useState({
     signsDetected: 0,
@@ -51,21 +55,28 @@ const Word = () => {
       if (!landmarks || landmarks.length !== 126) return;
 
       try {
-        const result = await predictWord(landmarks);
+        const result = recognition === 'fused'
+          ? await predictFused(landmarks)
+          : await predictWord(landmarks);
 
         if (!result || !result.label) return;
 
+        const type = result.type === 'letter' ? 'letter' : 'word';
         const prediction: Prediction = {
           text: result.label,
           confidence: result.confidence,
-          type: 'word',
+          type,
           timestamp: new Date()
         };
 
         setCurrentPrediction(prediction);
 
+        const afterLetter = lastType.current === 'letter';
+        lastType.current = type;
         setTranslatedText(prev => {
   if (!prev) return result.label;
+  // Fingerspelled letters join into one word
+  if (type === 'letter') return afterLetter ? prev + result.label : prev + " " + result.label;
   const lastWord = prev.split(" ").pop();
   if (lastWord === result.label) return prev;
   return prev + " " + result.label;
@@ -83,16 +94,17 @@ setHistory(prev => [entry, ...prev].slice(0, 50));
         setStats(prev => ({
           ...prev,
           signsDetected: prev.signsDetected + 1,
-          wordsTranslated: prev.wordsTranslated + 1
+          wordsTranslated: prev.wordsTranslated + (type === 'word' ? 1 : 0)
         }));
 
       } catch (err) {
         console.error("Word prediction error:", err);
       }
     },
-    [isCameraActive]
+    [isCameraActive, recognition]
   );
 const clearAll = useCallback(() => {
+  lastType.current = null;
   setTranslatedText("");
   setCurrentPrediction(null);
   setStats(prev => ({
@@ -131,6 +143,7 @@ const clearAll = useCallback(() => {
       };
       setHistory(prev => [entry, ...prev].slice(0, 50));
       setTranslatedText('');
+      lastType.current = null;
       setCurrentPrediction(null);
     }
   }, [isCameraActive, translatedText]);
@@ -144,9 +157,11 @@ const clearAll = useCallback(() => {
           initial={{ opacity: 0, y: 20 }}
           animate={{ opacity: 1, y: 0 }}
           transition={{ delay: 0.05 }}
-          className="mt-4"
+          className="mt-4 flex flex-wrap items-center gap-4"
         >
           <AlphabetWordToggle />
+          <InferenceToggle />
+          <RecognitionToggle recognition={recognition} onRecognitionChange={setRecognition} />
         </motion.div>
 
         <motion.div